@@ -2,20 +2,56 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ENV_PATH = BASE_DIR / ".env"
+_ENV_PATH_ARG = ENV_PATH if ENV_PATH.exists() else None
 
-load_dotenv(dotenv_path=ENV_PATH if ENV_PATH.exists() else None)
+# Optional precompiled .env values (generated by scripts/compile_env.py)
+try:
+    from app._env_compiled import ENV as _COMPILED_ENV
+except ImportError:
+    _COMPILED_ENV = None
+
+# Read back from globals() so importlib.reload() does not parse the .env file again
+_dotenv_loaded: bool = globals().get("_dotenv_loaded", False)
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file into os.environ unless it has already been loaded in this process."""
+    global _dotenv_loaded
+
+    if _dotenv_loaded:
+        return
+    if _COMPILED_ENV is not None:
+        # Same semantics as load_dotenv(): existing environment variables take precedence
+        for key, value in _COMPILED_ENV.items():
+            os.environ.setdefault(key, value)
+    else:
+        load_dotenv(dotenv_path=_ENV_PATH_ARG)
+    _dotenv_loaded = True
+
+
+def reload_dotenv() -> None:
+    """Force the .env file to be read again. Useful for tests."""
+    global _dotenv_loaded
+
+    _dotenv_loaded = False
+    _load_dotenv_once()
+
+
+_load_dotenv_once()
 
 DEFAULT_DB_URL = "mysql+pymysql://app_user:example-password@db:3306/app_db"
 DEFAULT_LOG_DIR = BASE_DIR / "logs"
+_DEFAULT_LOG_DIR_STR = str(DEFAULT_LOG_DIR)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database connection configuration."""
 
@@ -23,9 +59,12 @@ class DatabaseConfig:
     database_uri: str
     pool_size: int = 5
     max_overflow: int = 10
+    poolclass: str | None = None  # NULL, STATIC or QUEUE; None keeps the SQLAlchemy default
+    pool_recycle: int = 1800  # Seconds before a pooled connection is replaced; -1 disables
+    pool_pre_ping: bool = False  # Ping with SELECT 1 on every checkout
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CloudSQLConfig:
     """Cloud SQL Connector specific configuration."""
 
@@ -37,43 +76,67 @@ class CloudSQLConfig:
     ip_type: str = "PRIVATE"  # PRIVATE or PUBLIC (PRIMARY)
 
 
+@lru_cache(maxsize=1)
 def load_database_config() -> DatabaseConfig:
-    """Load database configuration from environment variables."""
-    use_cloud_sql = os.getenv("USE_CLOUD_SQL_CONNECTOR", "false").lower() == "true"
-    database_uri = os.getenv("DATABASE_URL", DEFAULT_DB_URL)
-    pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
-    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    """Load database configuration from environment variables.
+
+    The result is cached; call invalidate_config_cache() after changing the environment.
+    """
+    env_get = os.environ.get
+    use_cloud_sql = env_get("USE_CLOUD_SQL_CONNECTOR", "false").lower() == "true"
+    database_uri = env_get("DATABASE_URL", DEFAULT_DB_URL)
+    pool_size = int(env_get("DB_POOL_SIZE", "5"))
+    max_overflow = int(env_get("DB_MAX_OVERFLOW", "10"))
+    poolclass = env_get("DB_POOLCLASS", "").upper() or None
+    pool_recycle = int(env_get("DB_POOL_RECYCLE", "1800"))
+    pool_pre_ping = env_get("DB_POOL_PRE_PING", "false").lower() == "true"
+
+    if poolclass is not None and poolclass not in ("NULL", "STATIC", "QUEUE"):
+        raise ValueError(f"DB_POOLCLASS must be 'NULL', 'STATIC' or 'QUEUE', got: {poolclass}")
 
     return DatabaseConfig(
         use_cloud_sql_connector=use_cloud_sql,
         database_uri=database_uri,
         pool_size=pool_size,
         max_overflow=max_overflow,
+        poolclass=poolclass,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
     )
 
 
+# Environment variables required when USE_CLOUD_SQL_CONNECTOR=true
+_CLOUD_SQL_REQUIRED_VARS = ("CLOUDSQL_INSTANCE", "DB_USER", "DB_NAME")
+_CLOUD_SQL_IP_TYPES = frozenset({"PRIVATE", "PUBLIC"})
+
+
+@lru_cache(maxsize=1)
 def load_cloud_sql_config() -> CloudSQLConfig:
     """Load Cloud SQL Connector configuration from environment variables.
 
+    The result is cached; call invalidate_config_cache() after changing the environment.
+
     Raises:
         ValueError: If required environment variables are not set.
     """
-    instance_connection_name = os.getenv("CLOUDSQL_INSTANCE")
-    db_user = os.getenv("DB_USER")
-    db_name = os.getenv("DB_NAME")
-    enable_iam_auth = os.getenv("ENABLE_IAM_AUTH", "false").lower() == "true"
-    ip_type = os.getenv("CLOUDSQL_IP_TYPE", "PRIVATE").upper()
+    env_get = os.environ.get
+    instance_connection_name = env_get("CLOUDSQL_INSTANCE")
+    db_user = env_get("DB_USER")
+    db_name = env_get("DB_NAME")
+    enable_iam_auth = env_get("ENABLE_IAM_AUTH", "false").lower() == "true"
+    ip_type = env_get("CLOUDSQL_IP_TYPE", "PRIVATE").upper()
 
-    if not all([instance_connection_name, db_user, db_name]):
-        raise ValueError("CLOUDSQL_INSTANCE, DB_USER, and DB_NAME must be set when USE_CLOUD_SQL_CONNECTOR=true")
+    missing = [name for name in _CLOUD_SQL_REQUIRED_VARS if not env_get(name)]
+    if missing:
+        raise ValueError(f"CLOUDSQL_INSTANCE, DB_USER, and DB_NAME must be set when USE_CLOUD_SQL_CONNECTOR=true (missing: {', '.join(missing)})")
 
     # Password is required only when IAM auth is disabled
-    db_pass = os.getenv("DB_PASS")
+    db_pass = env_get("DB_PASS")
     if not enable_iam_auth and not db_pass:
         raise ValueError("DB_PASS must be set when ENABLE_IAM_AUTH=false")
 
     # Validate IP type
-    if ip_type not in ("PRIVATE", "PUBLIC"):
+    if ip_type not in _CLOUD_SQL_IP_TYPES:
         raise ValueError(f"CLOUDSQL_IP_TYPE must be 'PRIVATE' or 'PUBLIC', got: {ip_type}")
 
     return CloudSQLConfig(
@@ -86,36 +149,45 @@ def load_cloud_sql_config() -> CloudSQLConfig:
     )
 
 
+def invalidate_config_cache() -> None:
+    """Drop cached results of load_database_config() and load_cloud_sql_config()."""
+    load_database_config.cache_clear()
+    load_cloud_sql_config.cache_clear()
+
+
 class Config:
     """Base configuration loaded from environment variables."""
 
-    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", DEFAULT_DB_URL)
+    SQLALCHEMY_DATABASE_URI: str
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     # Logging configuration
-    LOG_DIR = os.getenv("LOG_DIR", str(DEFAULT_LOG_DIR))
-    FLASK_ENV = os.getenv("FLASK_ENV", "production")
+    LOG_DIR: str
+    FLASK_ENV: str
 
     # Set TESTING flag for test environment
-    TESTING = FLASK_ENV == "testing"
+    TESTING: bool
 
-    # Determine log level based on environment
-    # Development/Testing: DEBUG, Production: INFO
-    _env_log_level = os.getenv("LOG_LEVEL")
-    if _env_log_level:
-        LOG_LEVEL = _env_log_level.upper()
-    else:
-        LOG_LEVEL = "DEBUG" if FLASK_ENV in ("development", "testing") else "INFO"
+    # Development/Testing: DEBUG, Production: INFO (unless LOG_LEVEL is set)
+    LOG_LEVEL: str
 
     @classmethod
     def refresh(cls) -> None:
         """Reload env vars into config. Useful for tests."""
-        cls.SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", DEFAULT_DB_URL)
-        cls.LOG_DIR = os.getenv("LOG_DIR", str(DEFAULT_LOG_DIR))
-        cls.FLASK_ENV = os.getenv("FLASK_ENV", "production")
-        cls.TESTING = cls.FLASK_ENV == "testing"
-        _env_log_level = os.getenv("LOG_LEVEL")
-        if _env_log_level:
-            cls.LOG_LEVEL = _env_log_level.upper()
+        invalidate_config_cache()
+
+        env = os.environ
+        flask_env = env.get("FLASK_ENV", "production")
+        env_log_level = env.get("LOG_LEVEL")
+
+        cls.SQLALCHEMY_DATABASE_URI = env.get("DATABASE_URL", DEFAULT_DB_URL)
+        cls.LOG_DIR = env.get("LOG_DIR", _DEFAULT_LOG_DIR_STR)
+        cls.FLASK_ENV = flask_env
+        cls.TESTING = flask_env == "testing"
+        if env_log_level:
+            cls.LOG_LEVEL = env_log_level.upper()
         else:
-            cls.LOG_LEVEL = "DEBUG" if cls.FLASK_ENV in ("development", "testing") else "INFO"
+            cls.LOG_LEVEL = "DEBUG" if flask_env in ("development", "testing") else "INFO"
+
+
+Config.refresh()
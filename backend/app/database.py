@@ -1,32 +1,69 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from contextlib import contextmanager
-from typing import Iterator
+import re
+from dataclasses import replace
+from types import TracebackType
+from typing import Any
 
 from flask import g, has_app_context
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, scoped_session, sessionmaker
-from sqlalchemy.orm.scoping import ScopedSession
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, Pool, QueuePool, StaticPool
 
 from app.config import CloudSQLConfig, DatabaseConfig, load_cloud_sql_config, load_database_config
 
-# Conditional import for Cloud SQL Connector
-try:
-    from google.cloud.sql.connector import Connector, IPTypes
-
-    CLOUD_SQL_AVAILABLE = True
-except ImportError:
-    CLOUD_SQL_AVAILABLE = False
-    Connector = None  # type: ignore
-    IPTypes = None  # type: ignore
-
 logger = logging.getLogger(__name__)
 
+# Cloud SQL Connector classes, imported on first use by _load_cloud_sql()
+Connector: Any = None
+IPTypes: Any = None
+
 _engine: Engine | None = None
-_session_factory: ScopedSession[Session] | None = None
-_connector: Connector | None = None  # Cloud SQL Connector instance
+_session_factory: sessionmaker[Session] | None = None
+_connector: Any = None  # Cloud SQL Connector instance
+_connector_key: tuple[str, str, str, bool, str] | None = None  # Config the connector was created for
+
+# DB_POOLCLASS values -> SQLAlchemy pool classes
+_POOL_CLASSES: dict[str, type[Pool]] = {
+    "NULL": NullPool,
+    "STATIC": StaticPool,
+    "QUEUE": QueuePool,
+}
+
+# scheme://user:password@ -> captures "scheme://user" so the password can be replaced
+_URI_PASSWORD_RE = re.compile(r"(://[^:/@]+):[^@]+@")
+
+
+def _load_cloud_sql() -> tuple[Any, Any]:
+    """Import the Cloud SQL Connector on first use.
+
+    The connector package is heavy and only needed when USE_CLOUD_SQL_CONNECTOR=true,
+    so it is not imported at module load time.
+
+    Returns:
+        Tuple of (Connector, IPTypes).
+
+    Raises:
+        RuntimeError: If Cloud SQL Connector is not installed.
+    """
+    global Connector, IPTypes
+
+    if Connector is None or IPTypes is None:
+        try:
+            from google.cloud.sql.connector import Connector as connector_cls
+            from google.cloud.sql.connector import IPTypes as ip_types
+        except ImportError as exc:
+            raise RuntimeError("Cloud SQL Connector is not installed. Install with: pip install 'cloud-sql-python-connector[pymysql]'") from exc
+
+        if Connector is None:
+            Connector = connector_cls
+        if IPTypes is None:
+            IPTypes = ip_types
+
+    return Connector, IPTypes
 
 
 def _convert_ip_type_to_enum(ip_type_str: str):  # type: ignore
@@ -39,20 +76,19 @@ def _convert_ip_type_to_enum(ip_type_str: str):  # type: ignore
         IPTypes enum value.
 
     Raises:
+        RuntimeError: If Cloud SQL Connector is not installed.
         ValueError: If ip_type_str is not "PRIVATE" or "PUBLIC".
     """
-    if not CLOUD_SQL_AVAILABLE or IPTypes is None:
-        raise RuntimeError("Cloud SQL Connector is not available")
+    _, ip_types = _load_cloud_sql()
 
-    if ip_type_str == "PRIVATE":
-        return IPTypes.PRIVATE
-    elif ip_type_str == "PUBLIC":
-        return IPTypes.PUBLIC
-    else:
-        raise ValueError(f"Invalid IP type: {ip_type_str}. Must be 'PRIVATE' or 'PUBLIC'")
+    ip_type_map = {"PRIVATE": ip_types.PRIVATE, "PUBLIC": ip_types.PUBLIC}
+    try:
+        return ip_type_map[ip_type_str]
+    except KeyError:
+        raise ValueError(f"Invalid IP type: {ip_type_str}. Must be 'PRIVATE' or 'PUBLIC'") from None
 
 
-def _create_connection_factory(cloud_sql_config: CloudSQLConfig, connector: Connector):  # type: ignore
+def _create_connection_factory(cloud_sql_config: CloudSQLConfig, connector: Any):  # type: ignore
     """Create a connection factory function for Cloud SQL Connector.
 
     Args:
@@ -62,32 +98,70 @@ def _create_connection_factory(cloud_sql_config: CloudSQLConfig, connector: Conn
     Returns:
         A callable that creates database connections.
     """
+    # Connection arguments are resolved once per factory rather than on every new pooled connection
+    instance_connection_name = cloud_sql_config.instance_connection_name
+    conn_args: dict[str, str | bool] = {
+        "user": cloud_sql_config.db_user,
+        "db": cloud_sql_config.db_name,
+    }
+
+    if cloud_sql_config.enable_iam_auth:
+        # IAM authentication - no password needed
+        conn_args["enable_iam_auth"] = True
+        logger.debug("Using IAM authentication for Cloud SQL connection")
+    else:
+        # Password-based authentication
+        if cloud_sql_config.db_pass:
+            conn_args["password"] = cloud_sql_config.db_pass
+        logger.debug("Using password authentication for Cloud SQL connection")
+
+    # Convert IP type string to IPTypes enum
+    ip_type_enum = _convert_ip_type_to_enum(cloud_sql_config.ip_type)
+    logger.debug("Using IP type for Cloud SQL connections: %s (%s)", cloud_sql_config.ip_type, ip_type_enum)
 
     def getconn():  # type: ignore
         """Create a connection to Cloud SQL instance using the Connector."""
-        conn_args: dict[str, str | bool] = {
-            "user": cloud_sql_config.db_user,
-            "db": cloud_sql_config.db_name,
-        }
-
-        if cloud_sql_config.enable_iam_auth:
-            # IAM authentication - no password needed
-            conn_args["enable_iam_auth"] = True
-            logger.debug("Using IAM authentication for Cloud SQL connection")
-        else:
-            # Password-based authentication
-            if cloud_sql_config.db_pass:
-                conn_args["password"] = cloud_sql_config.db_pass
-            logger.debug("Using password authentication for Cloud SQL connection")
-
-        # Convert IP type string to IPTypes enum
-        ip_type_enum = _convert_ip_type_to_enum(cloud_sql_config.ip_type)
-        logger.debug(f"Connecting to Cloud SQL using IP type: {cloud_sql_config.ip_type} ({ip_type_enum})")
-        return connector.connect(cloud_sql_config.instance_connection_name, "pymysql", ip_type=ip_type_enum, **conn_args)
+        return connector.connect(instance_connection_name, "pymysql", ip_type=ip_type_enum, **conn_args)
 
     return getconn
 
 
+def _build_pool_kwargs(db_config: DatabaseConfig, *, default_sizing: bool) -> dict[str, Any]:
+    """Build the pool-related create_engine() arguments.
+
+    Connections are replaced by age (pool_recycle) instead of being pinged on every
+    checkout, unless DB_POOL_PRE_PING=true. Queue pools hand out the most recently
+    returned connection first (pool_use_lifo) so idle connections can time out.
+
+    Args:
+        db_config: Database configuration.
+        default_sizing: Whether the dialect's default pool accepts pool_size/max_overflow
+                        (used when DB_POOLCLASS is not set).
+
+    Returns:
+        Keyword arguments for create_engine().
+    """
+    pool_kwargs: dict[str, Any] = {
+        "pool_pre_ping": db_config.pool_pre_ping,
+        "pool_recycle": db_config.pool_recycle,
+    }
+
+    if db_config.poolclass is None:
+        # The default pool for server databases is a QueuePool
+        sized = default_sizing
+    else:
+        poolclass = _POOL_CLASSES[db_config.poolclass]
+        pool_kwargs["poolclass"] = poolclass
+        # Only QueuePool is sized; NullPool/StaticPool reject pool_size and max_overflow
+        sized = poolclass is QueuePool
+
+    if sized:
+        pool_kwargs["pool_size"] = db_config.pool_size
+        pool_kwargs["max_overflow"] = db_config.max_overflow
+        pool_kwargs["pool_use_lifo"] = True
+    return pool_kwargs
+
+
 def _create_cloud_sql_engine(db_config: DatabaseConfig, cloud_sql_config: CloudSQLConfig) -> Engine:
     """Create SQLAlchemy engine using Cloud SQL Python Connector.
 
@@ -101,17 +175,32 @@ def _create_cloud_sql_engine(db_config: DatabaseConfig, cloud_sql_config: CloudS
     Raises:
         RuntimeError: If Cloud SQL Connector is not available.
     """
-    global _connector
+    global _connector, _connector_key
 
-    if not CLOUD_SQL_AVAILABLE or Connector is None:
-        raise RuntimeError("Cloud SQL Connector is not installed. Install with: pip install 'cloud-sql-python-connector[pymysql]'")
+    connector_cls, _ = _load_cloud_sql()
 
-    logger.info(
-        f"Initializing Cloud SQL Connector: instance={cloud_sql_config.instance_connection_name}, "
-        f"user={cloud_sql_config.db_user}, db={cloud_sql_config.db_name}, iam_auth={cloud_sql_config.enable_iam_auth}"
+    connector_key = (
+        cloud_sql_config.instance_connection_name,
+        cloud_sql_config.db_user,
+        cloud_sql_config.db_name,
+        cloud_sql_config.enable_iam_auth,
+        cloud_sql_config.ip_type,
     )
 
-    _connector = Connector()
+    if _connector is not None and _connector_key == connector_key:
+        # Connector() starts background certificate refreshes, so keep it across re-initialisation
+        logger.info("Reusing existing Cloud SQL Connector")
+    else:
+        cleanup_connector()
+        logger.info(
+            "Initializing Cloud SQL Connector: instance=%s, user=%s, db=%s, iam_auth=%s",
+            cloud_sql_config.instance_connection_name,
+            cloud_sql_config.db_user,
+            cloud_sql_config.db_name,
+            cloud_sql_config.enable_iam_auth,
+        )
+        _connector = connector_cls()
+        _connector_key = connector_key
 
     # Create connection factory
     getconn = _create_connection_factory(cloud_sql_config, _connector)
@@ -120,9 +209,7 @@ def _create_cloud_sql_engine(db_config: DatabaseConfig, cloud_sql_config: CloudS
         "mysql+pymysql://",
         creator=getconn,
         future=True,
-        pool_pre_ping=True,
-        pool_size=db_config.pool_size,
-        max_overflow=db_config.max_overflow,
+        **_build_pool_kwargs(db_config, default_sizing=True),
     )
 
     logger.info("Cloud SQL Connector engine initialized successfully")
@@ -138,15 +225,7 @@ def _mask_password_in_uri(database_uri: str) -> str:
     Returns:
         URI with password replaced by '***'.
     """
-    safe_uri = database_uri
-    if "@" in database_uri:
-        parts = database_uri.split("@")
-        if "://" in parts[0]:
-            protocol_user = parts[0].split("://")
-            if ":" in protocol_user[1]:
-                user = protocol_user[1].split(":")[0]
-                safe_uri = f"{protocol_user[0]}://{user}:***@{parts[1]}"
-    return safe_uri
+    return _URI_PASSWORD_RE.sub(r"\1:***@", database_uri, count=1)
 
 
 def _create_standard_engine(db_config: DatabaseConfig) -> Engine:
@@ -159,21 +238,13 @@ def _create_standard_engine(db_config: DatabaseConfig) -> Engine:
         SQLAlchemy Engine instance.
     """
     safe_uri = _mask_password_in_uri(db_config.database_uri)
-    logger.info(f"Initializing standard database engine: {safe_uri}")
-
-    # Build engine kwargs
-    engine_kwargs: dict[str, bool | int] = {
-        "future": True,
-        "pool_pre_ping": True,
-    }
+    logger.info("Initializing standard database engine: %s", safe_uri)
 
-    # SQLite uses SingletonThreadPool which doesn't support pool_size and max_overflow
-    # Only add these parameters for non-SQLite databases
-    if not db_config.database_uri.startswith("sqlite"):
-        engine_kwargs["pool_size"] = db_config.pool_size
-        engine_kwargs["max_overflow"] = db_config.max_overflow
+    # SQLite's default pool doesn't support pool_size and max_overflow,
+    # so only size the default pool for non-SQLite databases
+    pool_kwargs = _build_pool_kwargs(db_config, default_sizing=not db_config.database_uri.startswith("sqlite"))
 
-    engine = create_engine(db_config.database_uri, **engine_kwargs)  # type: ignore
+    engine = create_engine(db_config.database_uri, future=True, **pool_kwargs)
 
     logger.info("Standard database engine initialized successfully")
     return engine
@@ -182,19 +253,20 @@ def _create_standard_engine(db_config: DatabaseConfig) -> Engine:
 def cleanup_connector() -> None:
     """Clean up Cloud SQL Connector resources.
 
-    Should be called when shutting down the application to properly close
-    the Connector instance and release resources.
+    Registered with atexit so the Connector instance and its background
+    refresh tasks are released when the process exits. Safe to call more than once.
     """
-    global _connector
+    global _connector, _connector_key
 
     if _connector is not None:
         logger.debug("Closing Cloud SQL Connector")
         _connector.close()
         _connector = None
+        _connector_key = None
 
 
 def init_engine(database_uri: str) -> None:
-    """Initialise SQLAlchemy engine and scoped session factory.
+    """Initialise SQLAlchemy engine and session factory.
 
     Args:
         database_uri: Database connection URI (used only when USE_CLOUD_SQL_CONNECTOR is false).
@@ -208,32 +280,30 @@ def init_engine(database_uri: str) -> None:
     """
     global _engine, _session_factory
 
-    if _session_factory is not None:
-        logger.debug("Removing existing session factory")
-        _session_factory.remove()
-
     if _engine is not None:
         logger.debug("Disposing existing database engine")
         _engine.dispose()
 
-    # Clean up existing connector if any
-    cleanup_connector()
-
     # Load database configuration from environment variables
     db_config = load_database_config()
 
     if db_config.use_cloud_sql_connector:
-        # Cloud SQL Connector mode
+        # Cloud SQL Connector mode (an existing connector is reused if its config is unchanged)
         cloud_sql_config = load_cloud_sql_config()
         _engine = _create_cloud_sql_engine(db_config, cloud_sql_config)
     else:
+        # The Cloud SQL Connector is not needed in this mode
+        cleanup_connector()
+
         # Standard connection mode (backward compatible)
         # Use database_uri parameter for backward compatibility
         # If database_uri is not provided, use the one from db_config
-        db_config.database_uri = database_uri or db_config.database_uri
+        # (copy instead of mutating, since load_database_config() results are cached)
+        db_config = replace(db_config, database_uri=database_uri or db_config.database_uri)
         _engine = _create_standard_engine(db_config)
 
-    _session_factory = scoped_session(sessionmaker(bind=_engine, autoflush=False, expire_on_commit=False))
+    # Sessions are scoped by flask.g (see get_session), so no scoped_session registry is needed
+    _session_factory = sessionmaker(bind=_engine, autoflush=False, expire_on_commit=False)
     logger.info("Database engine and session factory initialized successfully")
 
 
@@ -243,7 +313,7 @@ def get_engine() -> Engine:
     return _engine
 
 
-def get_session_factory() -> ScopedSession[Session]:
+def get_session_factory() -> sessionmaker[Session]:
     if _session_factory is None:
         raise RuntimeError("Database session factory is not initialised.")
     return _session_factory
@@ -251,39 +321,62 @@ def get_session_factory() -> ScopedSession[Session]:
 
 def get_session() -> Session:
     """Return a SQLAlchemy session bound to the current context."""
-    factory = get_session_factory()
-
-    if has_app_context():
-        session = g.get("db_session")
-        if session is None:
-            session = factory()
-            g.db_session = session
+    # Reading g directly avoids a has_app_context() probe on every call inside a request
+    try:
+        return g.db_session
+    except AttributeError:
+        # Created on first use and stored on g; app.main's teardown hook commits/rolls back and closes it
+        session = get_session_factory()()
+        g.db_session = session
         return session
+    except RuntimeError:
+        # Outside of Flask application context (e.g. in tests), return a new session.
+        return get_session_factory()()
 
-    # Outside of Flask application context (e.g. in tests), return a new session.
-    return factory()
 
+class _SessionScope:
+    """Provide a transactional scope for scripts or tests.
 
-@contextmanager
-def session_scope() -> Iterator[Session]:
-    """Provide a transactional scope for scripts or tests."""
-    session = get_session()
-    logger.debug("Starting database transaction scope")
-    try:
-        yield session
-        session.commit()
-        logger.debug("Database transaction committed successfully")
-    except Exception as e:
-        logger.error(f"Database transaction failed, rolling back: {e}", exc_info=True)
+    Implemented as a plain context manager class (rather than @contextmanager)
+    so entering and leaving the scope does not create a generator frame.
+    """
+
+    __slots__ = ("session", "in_app_context")
+
+    def __enter__(self) -> Session:
+        self.in_app_context = has_app_context()
+        self.session = get_session()
+        logger.debug("Starting database transaction scope")
+        return self.session
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        session = self.session
+        try:
+            if exc_type is None:
+                try:
+                    session.commit()
+                except Exception as commit_exc:
+                    self._rollback(session, commit_exc)
+                    raise
+                logger.debug("Database transaction committed successfully")
+            elif isinstance(exc, Exception):
+                self._rollback(session, exc)
+        finally:
+            if not self.in_app_context:
+                logger.debug("Closing database session outside Flask context")
+                session.close()
+
+    @staticmethod
+    def _rollback(session: Session, exc: Exception) -> None:
+        logger.error("Database transaction failed, rolling back: %s", exc, exc_info=exc)
         session.rollback()
-        raise
-    finally:
-        if not has_app_context():
-            logger.debug("Closing database session outside Flask context")
-            session.close()
-            get_session_factory().remove()
 
 
+session_scope = _SessionScope
+
+
+atexit.register(cleanup_connector)
+
 __all__ = [
     "init_engine",
     "cleanup_connector",
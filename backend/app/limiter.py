@@ -4,25 +4,159 @@ from __future__ import annotations
 
 import logging
 import os
+import socket
+import threading
+import time
+from functools import lru_cache, wraps
+from typing import Any, Callable, TypeVar
 
-from flask import Flask, Response, jsonify
+import redis
+from flask import Flask, Response, current_app, jsonify, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from limits.storage import RedisStorage
 from werkzeug.exceptions import TooManyRequests
 
 logger = logging.getLogger(__name__)
 
+RouteCallable = TypeVar("RouteCallable", bound=Callable[..., Any])
 
+# Redis connection pool shared by all rate limit checks in this process
+REDIS_POOL_MAX_CONNECTIONS = 32
+REDIS_POOL_TIMEOUT = 5  # Seconds to wait for a free connection before failing
+
+# TCP keepalive probes so idle pooled connections are not silently dropped by NAT/load balancers
+# (only the options supported by the current platform are set)
+_REDIS_KEEPALIVE_OPTIONS = {
+    option: value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if (option := getattr(socket, name, None)) is not None
+}
+
+# Upper bound on (client, endpoint) windows tracked by LocalFixedWindowLimiter
+LOCAL_WINDOW_MAX_KEYS = 10_000
+
+# Rejections remembered in process so over-limit clients are refused without a Redis round trip
+LOCAL_DENY_TTL = 1.0  # Seconds
+LOCAL_DENY_MAX_KEYS = 10_000
+# Own storage scheme, so the limits library's "redis" registration is left untouched
+LOCAL_DENY_SCHEME = "redis+localdeny"
+
+
+class LocalDenyCacheRedisStorage(RedisStorage):
+    """
+    Redis rate limit storage that remembers rejected keys in process for a short time.
+
+    Registered for the LOCAL_DENY_SCHEME scheme; init_limiter() rewrites the redis://
+    storage URI to it, and the URI is turned back into redis:// for the Redis client.
+
+    Note:
+        Once a key is over its limit, further hits on it are rejected locally for
+        LOCAL_DENY_TTL seconds without asking Redis. This is approximate: a slot freed
+        in Redis during that time is only seen after the local entry expires.
+        Allowed hits always go to Redis, which remains the source of truth.
+    """
+
+    STORAGE_SCHEME = [LOCAL_DENY_SCHEME]
+
+    def __init__(self, uri: str, *args: Any, **kwargs: Any) -> None:
+        super().__init__("redis" + uri.removeprefix(LOCAL_DENY_SCHEME), *args, **kwargs)
+        # (key, limit, expiry, amount) -> monotonic time until which hits are rejected
+        self._denied_until: dict[tuple[str, int, int, int], float] = {}
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        cache_key = (key, limit, expiry, amount)
+        now = time.monotonic()
+        denied_until = self._denied_until.get(cache_key)
+        if denied_until is not None:
+            if now < denied_until:
+                return False
+            self._denied_until.pop(cache_key, None)
+
+        if super().acquire_entry(key, limit, expiry, amount):
+            return True
+
+        if len(self._denied_until) >= LOCAL_DENY_MAX_KEYS:
+            # Entries live for about a second, so dropping all of them only costs a few extra Redis calls
+            self._denied_until.clear()
+        self._denied_until[cache_key] = now + LOCAL_DENY_TTL
+        return False
+
+    def clear(self, key: str) -> None:
+        for cache_key in [cache_key for cache_key in self._denied_until if cache_key[0] == key]:
+            self._denied_until.pop(cache_key, None)
+        super().clear(key)
+
+    def reset(self) -> int | None:
+        self._denied_until.clear()
+        return super().reset()
+
+
+class LocalFixedWindowLimiter:
+    """
+    In-process fixed-window rate limiter for endpoints that do not need a shared count.
+
+    Note:
+        Counts live in each worker process, so the effective limit across the deployment
+        is the per-process limit times the number of workers. Use it only where that is
+        acceptable (token refresh, logout); brute-force sensitive routes such as login
+        stay on the shared Flask-Limiter storage. Decorated routes should also be marked
+        with limiter.exempt so they skip the Redis check entirely.
+    """
+
+    def __init__(self) -> None:
+        # (client address, endpoint) -> [hit count, monotonic window start]
+        self._windows: dict[tuple[str, str], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: tuple[str, str], limit: int, period: float) -> bool:
+        """Record one hit for key and return False if it exceeds limit within the current window."""
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[1] >= period:
+                if len(self._windows) >= LOCAL_WINDOW_MAX_KEYS:
+                    # Windows last a minute, so dropping all of them only lets a few extra hits through
+                    self._windows.clear()
+                self._windows[key] = [1, now]
+                return True
+            window[0] += 1
+            return window[0] <= limit
+
+    def limit(self, limit: int, period: float = 60.0) -> Callable[[RouteCallable], RouteCallable]:
+        """Reject requests from one client address beyond limit per period seconds with 429."""
+
+        def decorator(func: RouteCallable) -> RouteCallable:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any):
+                if current_app.config.get("RATELIMIT_ENABLED", True):
+                    key = (get_remote_address(), request.endpoint or "")
+                    if not self.hit(key, limit, period):
+                        raise TooManyRequests(description=f"{limit} per {period:g} seconds")
+                return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def reset(self) -> None:
+        """Forget all windows."""
+        with self._lock:
+            self._windows.clear()
+
+
+@lru_cache(maxsize=1)
 def get_limiter_storage_uri() -> str:
     """
-    Get storage URI for Flask-Limiter at module load time.
+    Get storage URI for Flask-Limiter.
 
     Returns:
         Redis URI if configured and enabled, otherwise "memory://" for in-memory storage
 
     Note:
-        This function is called at module import time, before Flask app initialization.
-        It reads directly from environment variables.
+        This function is called from init_limiter(), not at module import time.
+        It reads directly from environment variables and caches the result;
+        call get_limiter_storage_uri.cache_clear() after changing them.
     """
     # Check if rate limiting is enabled
     rate_limit_enabled = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
@@ -48,28 +182,56 @@ def get_limiter_storage_uri() -> str:
         uri = f"redis://{redis_host}:{redis_port}/0"
 
     # Log connection (mask password)
-    safe_uri = f"redis://{'***@' if redis_password else ''}{redis_host}:{redis_port}/0"
-    logger.info(f"Configured Redis storage for rate limiting: {safe_uri}")
+    logger.info("Configured Redis storage for rate limiting: redis://%s%s:%s/0", "***@" if redis_password else "", redis_host, redis_port)
 
     return uri
 
 
-# Global limiter instance with proper storage configuration
-# Storage URI is determined at module load time from environment variables
+@lru_cache(maxsize=1)
+def get_redis_connection_pool(uri: str) -> redis.BlockingConnectionPool:
+    """
+    Get the bounded Redis connection pool for the rate limiter.
+
+    Args:
+        uri: Redis URI returned by get_limiter_storage_uri()
+
+    Returns:
+        Connection pool shared by every limiter storage created in this process
+
+    Note:
+        Without a shared pool, the limits library creates its own client via
+        redis.from_url(), so connections multiply across workers and app instances.
+        BlockingConnectionPool waits for a free connection instead of opening more.
+    """
+    return redis.BlockingConnectionPool.from_url(
+        uri,
+        max_connections=REDIS_POOL_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        socket_connect_timeout=30,
+        socket_timeout=30,
+        socket_keepalive=True,
+        socket_keepalive_options=_REDIS_KEEPALIVE_OPTIONS,
+    )
+
+
+# Global limiter instance
+# Storage URI is resolved in init_limiter() so importing this module stays cheap
 limiter = Limiter(
     key_func=get_remote_address,  # Use client IP as rate limit key
-    storage_uri=get_limiter_storage_uri(),  # Redis or memory storage
-    storage_options={"socket_connect_timeout": 30, "socket_timeout": 30},
     # Default limits (can be overridden per route)
     default_limits=["200 per hour", "50 per minute"],
     # Swallow errors (don't fail requests if Redis is down)
     swallow_errors=True,
     # Headers in response
     headers_enabled=True,
-    # Strategy: fixed-window (simple and performant)
-    strategy="fixed-window",
+    # Strategy: moving-window (no 2x burst at window boundaries; the Redis storage
+    # checks and records each hit atomically in a single Lua script call)
+    strategy="moving-window",
 )
 
+# Global in-process limiter for routes exempted from the shared limiter
+local_limiter = LocalFixedWindowLimiter()
+
 
 def rate_limit_error_handler(e: TooManyRequests) -> tuple[Response, int]:
     """
@@ -81,7 +243,7 @@ def rate_limit_error_handler(e: TooManyRequests) -> tuple[Response, int]:
     Returns:
         JSON error response with 429 status code
     """
-    logger.warning(f"Rate limit exceeded: {e.description}")
+    logger.warning("Rate limit exceeded: %s", e.description)
     return jsonify({"error": "リクエストが多すぎます。しばらく待ってから再試行してください。"}), 429
 
 
@@ -96,26 +258,28 @@ def init_limiter(app: Flask) -> Limiter:
         Configured Limiter instance
 
     Note:
-        The limiter is already configured with storage URI at module load time.
-        This function binds the limiter to the Flask app and registers error handlers.
+        This function resolves the storage URI (Redis or memory), binds the limiter
+        to the Flask app and registers error handlers.
     """
-    # Bind limiter to Flask app
+    # Resolve storage backend from environment variables (Redis or memory storage)
+    storage_uri = get_limiter_storage_uri()
+    if storage_uri.startswith("redis://"):
+        app.config.setdefault("RATELIMIT_STORAGE_URI", LOCAL_DENY_SCHEME + storage_uri.removeprefix("redis"))
+        app.config.setdefault("RATELIMIT_STORAGE_OPTIONS", {"connection_pool": get_redis_connection_pool(storage_uri)})
+    else:
+        app.config.setdefault("RATELIMIT_STORAGE_URI", storage_uri)
+
+    # Bind limiter to Flask app; in-process windows start empty like a fresh memory storage
     limiter.init_app(app)
+    local_limiter.reset()
 
     # Register custom error handler for 429 responses
     app.register_error_handler(429, rate_limit_error_handler)
 
     # Log the storage backend being used
-    if limiter._storage and hasattr(limiter._storage, "storage_uri"):
-        storage_uri = limiter._storage.storage_uri
-        if "redis" in str(storage_uri):
-            logger.info("Rate limiter initialized with Redis backend")
-        else:
-            logger.info("Rate limiter initialized with in-memory backend")
-    else:
-        logger.info("Rate limiter initialized with in-memory backend")
+    logger.info("Rate limiter initialized with %s backend", "Redis" if storage_uri.startswith("redis://") else "in-memory")
 
     return limiter
 
 
-__all__ = ["init_limiter", "limiter"]
+__all__ = ["init_limiter", "limiter", "local_limiter"]
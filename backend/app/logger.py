@@ -1,41 +1,80 @@
 from __future__ import annotations
 
+import atexit
+import io
 import json
 import logging
+import os
+import queue
 import re
+import signal
 import sys
-from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+import threading
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Any
+from types import FrameType
+from typing import Any, cast
 
 from flask import g, has_request_context
 
+# Background thread that runs the real handlers (see setup_logging)
+_queue_listener: QueueListener | None = None
+
+# (log_dir, log_level, is_development, is_testing) of the last setup_logging call and the handler it added to root
+_active_setup: tuple[tuple[str, str, bool, bool], logging.Handler] | None = None
+
+_LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+
+class LazyRequestID:
+    """Request ID that only generates its UUID the first time it is converted to str.
+
+    Requests that never emit a log record skip uuid4() (an os.urandom call) entirely.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value: str | None = None
+
+    def __str__(self) -> str:
+        value = self._value
+        if value is None:
+            value = self._value = str(uuid.uuid4())
+        return value
+
 
 class RequestIDFilter(logging.Filter):
     """Add request ID to log records when available."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        """Add request_id attribute to log record."""
-        if has_request_context() and hasattr(g, "request_id"):
-            record.request_id = g.request_id
-        else:
-            record.request_id = "no-request"
+        """Add request_id attribute to log record.
+
+        Must run on the logging thread (attached to the QueueHandler, not the
+        listener's handlers) since the request context is thread-local. A
+        LazyRequestID is resolved here, on the request's own thread, so all
+        records of a request carry the same ID.
+        """
+        record.request_id = str(g.request_id) if has_request_context() and "request_id" in g else "no-request"
         return True
 
 
 class SensitiveDataFilter(logging.Filter):
     """Filter sensitive information from log messages."""
 
-    # Patterns to detect and mask sensitive data
-    SENSITIVE_PATTERNS = [
-        (re.compile(r"(password['\"\s:=]+)[\w\S]+", re.IGNORECASE), r"\1***"),
-        (re.compile(r"(token['\"\s:=]+)[\w\S]+", re.IGNORECASE), r"\1***"),
-        (re.compile(r"(api[_-]?key['\"\s:=]+)[\w\S]+", re.IGNORECASE), r"\1***"),
-        (re.compile(r"(secret['\"\s:=]+)[\w\S]+", re.IGNORECASE), r"\1***"),
-        (re.compile(r"(authorization['\"\s:=]+bearer\s+)[\w\S]+", re.IGNORECASE), r"\1***"),
-        (re.compile(r"([\w.+-]+@\w+\.[\w.-]+)"), "***"),
-    ]
+    # Single pattern to detect and mask sensitive data in one pass.
+    # "keep" captures the label (e.g. "password=") that stays in the output; emails have no label.
+    SENSITIVE_PATTERN = re.compile(
+        r"(?P<keep>(?:password|token|api[_-]?key|secret)['\"\s:=]+|authorization['\"\s:=]+bearer\s+)[\w\S]+|[\w.+-]+@\w+\.[\w.-]+",
+        re.IGNORECASE,
+    )
+
+    # Cheap pre-check: strings without any of these substrings cannot match SENSITIVE_PATTERN.
+    # ASCII-only case folding is enough for these literals; SENSITIVE_PATTERN itself stays
+    # Unicode-aware since messages contain Japanese text (e.g. U+3000 spaces end a masked value).
+    SENSITIVE_PREFILTER = re.compile(r"password|token|secret|api|auth|@", re.IGNORECASE | re.ASCII)
 
     SENSITIVE_KEYWORDS = (
         "password",
@@ -51,10 +90,9 @@ class SensitiveDataFilter(logging.Filter):
     )
 
     def _mask_string(self, value: str) -> str:
-        masked = value
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            masked = pattern.sub(replacement, masked)
-        return masked
+        if not self.SENSITIVE_PREFILTER.search(value):
+            return value
+        return self.SENSITIVE_PATTERN.sub(_mask_match, value)
 
     def _should_mask_key(self, key: Any) -> bool:
         if key is None:
@@ -66,65 +104,208 @@ class SensitiveDataFilter(logging.Filter):
         return any(keyword in key_str for keyword in self.SENSITIVE_KEYWORDS)
 
     def _sanitize(self, value: Any, *, key: Any | None = None) -> Any:
-        if value is None:
-            return None
+        """Return value with sensitive data masked.
 
+        Containers are copied only when something inside them is masked, so payloads
+        without sensitive data are returned as-is and caller-owned objects (e.g. dicts
+        passed via ``extra``) are never modified.
+        """
         if isinstance(value, str):
             if key is not None and self._should_mask_key(key):
                 return "***"
             return self._mask_string(value)
 
         if isinstance(value, dict):
-            sanitized_dict: dict[Any, Any] = {}
+            sanitized_dict: dict[Any, Any] | None = None
             for dict_key, dict_value in value.items():
-                if self._should_mask_key(dict_key):
-                    sanitized_dict[dict_key] = "***"
-                else:
-                    sanitized_dict[dict_key] = self._sanitize(dict_value)
-            return sanitized_dict
-
-        if isinstance(value, list):
-            return [self._sanitize(item) for item in value]
-
-        if isinstance(value, tuple):
-            return tuple(self._sanitize(item) for item in value)
+                new_value = "***" if self._should_mask_key(dict_key) else self._sanitize(dict_value)
+                if new_value is not dict_value:
+                    if sanitized_dict is None:
+                        sanitized_dict = dict(value)
+                    sanitized_dict[dict_key] = new_value
+            return value if sanitized_dict is None else sanitized_dict
+
+        if isinstance(value, (list, tuple)):
+            sanitized_items: list[Any] | None = None
+            for index, item in enumerate(value):
+                new_item = self._sanitize(item)
+                if new_item is not item:
+                    if sanitized_items is None:
+                        sanitized_items = list(value)
+                    sanitized_items[index] = new_item
+            if sanitized_items is None:
+                return value
+            return tuple(sanitized_items) if isinstance(value, tuple) else sanitized_items
 
         return value
 
     def filter(self, record: logging.LogRecord) -> bool:
-        """Mask sensitive information in log messages and structured data."""
-        if hasattr(record, "msg") and isinstance(record.msg, str):
-            record.msg = self._mask_string(record.msg)
+        """Mask sensitive information in log messages and structured data.
+
+        Handler filters only run for records at or above the handler's level,
+        so no separate level check is needed here. A %-style template is never masked
+        on its own (masking "token: %s" would eat the placeholder): args are masked,
+        merged into msg and the rendered message is masked. Only string args are
+        masked before merging, so exceptions are logged as str(exc).
+        """
+        sanitize = self._sanitize
 
         if hasattr(record, "args") and record.args:
             try:
-                if isinstance(record.args, dict):
-                    record.args = {
-                        key: ("***" if self._should_mask_key(key) else self._sanitize(value, key=key)) for key, value in record.args.items()
-                    }
-                elif isinstance(record.args, (list, tuple)):
-                    sanitized_args = [self._sanitize(arg) for arg in record.args]
-                    record.args = tuple(sanitized_args) if isinstance(record.args, tuple) else sanitized_args
-                else:
-                    record.args = self._sanitize(record.args)
+                record.args = sanitize(record.args)
             except Exception:
                 pass
 
-        for attr, value in list(record.__dict__.items()):
-            if attr in LOG_RECORD_RESERVED_ATTRS:
+        if hasattr(record, "msg") and isinstance(record.msg, str):
+            if record.args and "%" in record.msg:
+                try:
+                    rendered = record.msg % record.args
+                except (TypeError, ValueError):
+                    # Left for logging to report as a formatting error
+                    rendered = None
+                if rendered is not None:
+                    record.msg = self._mask_string(rendered)
+                    record.args = None
+            else:
+                record.msg = self._mask_string(record.msg)
+
+        if not _has_extra_attrs(record):
+            return True
+
+        record_dict = record.__dict__
+        reserved = LOG_RECORD_RESERVED_ATTRS
+        for attr, value in list(record_dict.items()):
+            if attr in reserved:
                 continue
-            record.__dict__[attr] = self._sanitize(value, key=attr)
+            sanitized = sanitize(value, key=attr)
+            if sanitized is not value:
+                record_dict[attr] = sanitized
 
         return True
 
 
+def _mask_match(match: re.Match[str]) -> str:
+    return f"{match.group('keep') or ''}***"
+
+
+class _LogQueueHandler(QueueHandler):
+    """QueueHandler that renders the message on the logging thread.
+
+    The message is built here, while args (mutable objects, ORM instances) are still in
+    the state the caller logged them in; SensitiveDataFilter is attached to this handler
+    so args are masked before they are merged into msg. Unlike the default prepare(),
+    exc_info is kept for JsonFormatter's exception field: records never leave this
+    process, so they do not need to be made picklable.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty.
+
+    Together with _BufferedTimedRotatingFileHandler this writes bursts of records
+    with one flush instead of one per record, while idle periods still leave
+    everything on disk.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        log_queue = cast("queue.SimpleQueue[logging.LogRecord]", self.queue)
+        try:
+            return log_queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return log_queue.get(block)
+
+
+class _BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """TimedRotatingFileHandler that does not flush after every record.
+
+    The file is opened with a 64 KiB buffer. Records below WARNING stay buffered
+    until _FlushingQueueListener flushes (queue empty), the file rotates or the
+    handler is closed; WARNING and above are flushed immediately so diagnostics
+    are on disk even if the process dies right after.
+    """
+
+    _defer_flush = False
+
+    def _open(self) -> io.TextIOWrapper:
+        # self.mode is a plain str, so open() cannot infer that this is a text stream
+        return cast(io.TextIOWrapper, open(self.baseFilename, self.mode, buffering=_LOG_FILE_BUFFER_SIZE, encoding=self.encoding, errors=self.errors))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit() calls flush() after writing; skip it for low-severity records
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued log records and close the handlers behind the queue.
+
+    Registered with atexit; safe to call more than once.
+    """
+    global _queue_listener, _active_setup
+
+    _active_setup = None
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+
+def _exit_on_sigterm(signum: int, frame: FrameType | None) -> None:
+    sys.exit(128 + signum)
+
+
+def _install_sigterm_exit() -> None:
+    """Make SIGTERM exit the interpreter normally so atexit flushes queued log records.
+
+    SIGTERM's default action kills the process without running atexit handlers.
+    The handler is only installed while SIGTERM still has its default action, so
+    servers that handle it themselves (e.g. gunicorn workers, which shut down
+    gracefully and run atexit) are left alone.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Most records share their second with the previous one, so the date part is formatted once per second
+        self._last_sec = -1
+        self._last_sec_str = ""
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Format a record's creation time as a local ISO 8601 timestamp with milliseconds."""
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+            self._last_sec = sec
+        return f"{self._last_sec_str}.{int(record.msecs):03d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -141,28 +322,55 @@ class JsonFormatter(logging.Formatter):
             log_data["line"] = record.lineno
             log_data["function"] = record.funcName
 
-        extra_data = {key: value for key, value in record.__dict__.items() if key not in LOG_RECORD_RESERVED_ATTRS and key not in log_data}
+        # Extra data is added in place; keys already set above take precedence
+        if _has_extra_attrs(record):
+            reserved = LOG_RECORD_RESERVED_ATTRS
+            for key, value in record.__dict__.items():
+                if key not in reserved:
+                    log_data.setdefault(key, value)
 
-        if extra_data:
-            log_data.update(extra_data)
-
-        return json.dumps(log_data, ensure_ascii=False, default=_json_serialize)
+        return _JSON_ENCODER.encode(log_data)
 
 
 class StructuredTextFormatter(logging.Formatter):
     """Text formatter that appends structured key/value pairs."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (record, output) of the last call; the console and file handlers share this formatter,
+        # so the second handler reuses the first handler's output instead of formatting again.
+        # Kept as one tuple so concurrent callers never see a record paired with another's output.
+        self._last_formatted: tuple[logging.LogRecord, str] | None = None
+        # Same per-second timestamp cache as JsonFormatter (datefmt has no sub-second part)
+        self._last_sec = -1
+        self._last_sec_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec_str = time.strftime(datefmt, self.converter(sec))
+            self._last_sec = sec
+        return self._last_sec_str
+
     def format(self, record: logging.LogRecord) -> str:
+        last_formatted = self._last_formatted
+        if last_formatted is not None and last_formatted[0] is record:
+            return last_formatted[1]
+
+        output = self._format(record)
+        self._last_formatted = (record, output)
+        return output
+
+    def _format(self, record: logging.LogRecord) -> str:
         base_message = super().format(record)
-        extra_parts = []
-        for key, value in record.__dict__.items():
-            if key in LOG_RECORD_RESERVED_ATTRS or key == "message":
-                continue
-            extra_parts.append(f"{key}={_stringify(value)}")
+        if not _has_extra_attrs(record):
+            return base_message
 
-        if extra_parts:
-            return f"{base_message} | {' '.join(extra_parts)}"
-        return base_message
+        reserved = LOG_RECORD_RESERVED_ATTRS
+        extra_parts = [f"{key}={_stringify(value)}" for key, value in record.__dict__.items() if key not in reserved]
+        return f"{base_message} | {' '.join(extra_parts)}"
 
 
 def _stringify(value: Any) -> str:
@@ -188,31 +396,75 @@ def _json_serialize(value: Any) -> Any:
     return str(value)
 
 
-LOG_RECORD_RESERVED_ATTRS = {
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "exc_info",
-    "exc_text",
-    "stack_info",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
-    "message",
-    "asctime",
-    "request_id",
-}
+# Shared encoder: json.dumps() with non-default options builds a new JSONEncoder on every call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, default=_json_serialize)
+
+# Standard LogRecord attributes (plus request_id) that are not treated as extra data
+LOG_RECORD_RESERVED_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "message",
+        "asctime",
+        "request_id",
+    }
+)
+
+
+def _rotated_log_namer(default_name: str) -> str:
+    """Generate date-based filename for rotated logs."""
+    # TimedRotatingFileHandler appends a timestamp, we want just the date
+    # Extract the date portion and create a clean filename (os.path keeps this portable)
+    dir_name, base_name = os.path.split(default_name)
+    if base_name.count(".") >= 2:  # app-2025-10-27.log.2025-10-28 -> app-2025-10-28.log
+        date_suffix = base_name.rpartition(".")[2]  # 2025-10-28
+        return os.path.join(dir_name, f"app-{date_suffix}.log")
+    return default_name
+
+
+def _has_extra_attrs(record: logging.LogRecord) -> bool:
+    """Return True if the record carries attributes passed via ``extra``.
+
+    Most log calls pass no extra data; the subset check runs in C, so those records
+    skip the per-attribute loops entirely.
+    """
+    return not record.__dict__.keys() <= LOG_RECORD_RESERVED_ATTRS
+
+
+def _clear_handlers(target_logger: logging.Logger) -> None:
+    """Close and detach all handlers of target_logger."""
+    for handler in target_logger.handlers:
+        handler.close()
+    target_logger.handlers.clear()
+
+
+def _configure_app_logger(app_logger: logging.Logger, numeric_level: int) -> None:
+    """Make app_logger write only through the root logger's handlers.
+
+    Handlers live on the root logger alone, so each record is formatted and written once.
+    """
+    app_logger.setLevel(numeric_level)
+    _clear_handlers(app_logger)
+    app_logger.propagate = True
 
 
 def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: str, is_development: bool, is_testing: bool = False) -> None:
@@ -225,7 +477,17 @@ def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: st
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         is_development: If True, also output logs to console with text format
         is_testing: If True, skip file logging (console only)
+
+    Note:
+        Outside of testing, the root logger only gets a QueueHandler. Filtering and message
+        rendering happen on the calling thread; formatting and I/O run on a QueueListener
+        thread so request threads never block on writes.
+
+        Calling it again with the same arguments (e.g. create_app() in every test) only
+        reconfigures app_logger and keeps the existing handlers and log files open.
     """
+    global _queue_listener, _active_setup
+
     # Convert log_level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
@@ -233,21 +495,22 @@ def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: st
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Clear existing handlers from root logger
-    for handler in root_logger.handlers[:]:
-        handler.close()
-        root_logger.removeHandler(handler)
+    # Determine if this is production (not development and not testing)
+    is_production = not is_development and not is_testing
 
-    # Configure Flask app logger level (it will use root logger's handlers)
-    app_logger.setLevel(numeric_level)
+    setup_key = (str(log_dir), log_level.upper(), is_development, is_testing)
+    if _active_setup is not None and _active_setup[0] == setup_key and _active_setup[1] in root_logger.handlers:
+        _configure_app_logger(app_logger, numeric_level)
+        return
 
-    # Clear Flask app logger's default handlers to avoid duplicates
-    for handler in app_logger.handlers[:]:
-        handler.close()
-        app_logger.removeHandler(handler)
+    # Stop the listener of a previous call (flushes queued records) before replacing handlers
+    _stop_queue_listener()
 
-    # Determine if this is production (not development and not testing)
-    is_production = not is_development and not is_testing
+    # Clear existing handlers from root logger
+    _clear_handlers(root_logger)
+
+    # Flask app logger keeps no handlers of its own and uses the root logger's
+    _configure_app_logger(app_logger, numeric_level)
 
     # Create formatter based on environment
     # Production uses JSON for structured logging, others use text format
@@ -272,7 +535,8 @@ def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: st
         console_handler.addFilter(request_id_filter)
         console_handler.addFilter(sensitive_data_filter)
         root_logger.addHandler(console_handler)
-        app_logger.info(f"Logging initialized: level={log_level}, mode=testing (console only)")
+        _active_setup = (setup_key, console_handler)
+        app_logger.info("Logging initialized: level=%s, mode=testing (console only)", log_level)
         return
 
     handlers: list[logging.Handler] = []
@@ -281,24 +545,22 @@ def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: st
     console_handler = logging.StreamHandler(stream=sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(request_id_filter)
-    console_handler.addFilter(sensitive_data_filter)
     handlers.append(console_handler)
 
-    log_file: Path | None = None
+    log_file: str | None = None
 
     if not is_production:
         # Create log directory if it doesn't exist
-        log_path = Path(log_dir)
-        log_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(log_dir, exist_ok=True)
 
         # Configure log file path with current date (e.g., app-2025-10-27.log)
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        log_file = log_path / f"app-{current_date}.log"
+        # Local time, matching the handler's midnight rotation (utc=False)
+        current_date = time.strftime("%Y-%m-%d")
+        log_file = os.path.join(log_dir, f"app-{current_date}.log")
 
         # Create file handler with daily rotation (midnight), keeping 5 backups
-        file_handler = TimedRotatingFileHandler(
-            filename=str(log_file),
+        file_handler = _BufferedTimedRotatingFileHandler(
+            filename=log_file,
             when="midnight",  # Rotate at midnight
             interval=1,  # Daily
             backupCount=5,  # Keep 5 old log files
@@ -306,27 +568,23 @@ def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: st
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(request_id_filter)
-        file_handler.addFilter(sensitive_data_filter)
 
         # Custom namer to ensure rotated files have date-based names
-        def namer(default_name: str) -> str:
-            """Generate date-based filename for rotated logs."""
-            # TimedRotatingFileHandler appends a timestamp, we want just the date
-            # Extract the date portion and create a clean filename
-            dir_name, base_name = default_name.rsplit("/", 1) if "/" in default_name else ("", default_name)
-            parts = base_name.split(".")
-            if len(parts) >= 3:  # app-2025-10-27.log.2025-10-28 -> app-2025-10-28.log
-                # Extract the date from the suffix
-                date_suffix = parts[-1]  # 2025-10-28
-                return f"{dir_name}/app-{date_suffix}.log" if dir_name else f"app-{date_suffix}.log"
-            return default_name
-
-        file_handler.namer = namer
+        file_handler.namer = _rotated_log_namer
         handlers.append(file_handler)
 
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    # Request threads only enqueue records; RequestIDFilter and SensitiveDataFilter run on the
+    # enqueue side because the request context and the caller's args are not safe to use later
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _LogQueueHandler(log_queue)
+    queue_handler.addFilter(request_id_filter)
+    queue_handler.addFilter(sensitive_data_filter)
+    root_logger.addHandler(queue_handler)
+
+    _queue_listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    _install_sigterm_exit()
+    _active_setup = (setup_key, queue_handler)
 
     # Configure werkzeug logger to reduce noise in production
     werkzeug_logger = logging.getLogger("werkzeug")
@@ -341,7 +599,9 @@ def setup_logging(app_logger: logging.Logger, log_dir: str | Path, log_level: st
     outputs = ["console=stdout"]
     if log_file is not None:
         outputs.insert(0, f"file={log_file}")
-    app_logger.info(f"Logging initialized: level={log_level}, format={format_type}, outputs={', '.join(outputs)}")
+    app_logger.info("Logging initialized: level=%s, format=%s, outputs=%s", log_level, format_type, ", ".join(outputs))
+
 
+atexit.register(_stop_queue_listener)
 
-__all__ = ["setup_logging"]
+__all__ = ["LazyRequestID", "setup_logging"]
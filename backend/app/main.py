@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import logging
 import os
 import time
-import uuid
+from datetime import datetime, timezone
 
 from flask import Flask, Response, g, jsonify, request
-from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
 from .config import Config
-from .database import get_engine, get_session_factory, init_engine
+from .database import get_engine, get_session_factory, init_engine, session_scope
 from .limiter import init_limiter
-from .logger import setup_logging
+from .logger import LazyRequestID, setup_logging
+from .repositories.refresh_token_repository import RefreshTokenRepository
 from .routes import api_bp
 
+# The 500 body never changes, so it is serialized once instead of through jsonify on every error
+_INTERNAL_ERROR_BODY = b'{"error":{"code":500,"message":"Internal server error"}}'
+
 
 def _register_error_handlers(app: Flask) -> None:
     @app.errorhandler(HTTPException)
@@ -37,48 +41,79 @@ def _register_error_handlers(app: Flask) -> None:
             exc_info=True,
             extra={"error_type": type(err).__name__, "path": request.path, "http_method": request.method},
         )
-        response = jsonify(error={"code": 500, "message": "Internal server error"})
-        return response, 500
+        # A new Response per error, since after_request hooks mutate its headers
+        return app.response_class(_INTERNAL_ERROR_BODY, status=500, mimetype="application/json")
 
 
 def _register_request_hooks(app: Flask) -> None:
     """Register request lifecycle hooks for tracing and logging."""
+    # Bound once here instead of being looked up on every request
+    logger = app.logger
+    perf_counter_ns = time.perf_counter_ns
 
     @app.before_request
     def set_request_id() -> None:
-        """Generate a unique request ID for tracing."""
-        g.request_id = str(uuid.uuid4())
-        g.start_time = time.time()
+        """Attach a request ID for tracing (the UUID is generated when first logged)."""
+        g.request_id = LazyRequestID()
+        g.start_ns = perf_counter_ns()
 
     @app.after_request
     def log_request_completion(response: Response) -> Response:
         """Log request completion with timing information."""
-        if hasattr(g, "start_time") and hasattr(g, "request_id"):
-            elapsed_ms = (time.time() - g.start_time) * 1000
-            forwarded_for = request.headers.get("X-Forwarded-For")
-            client_ip = forwarded_for.split(",")[0].strip() if forwarded_for else (request.remote_addr or "unknown")
-            app.logger.info(
-                "Request completed",
-                extra={
-                    "http_method": request.method,
-                    "path": request.path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(elapsed_ms, 2),
-                    "client_ip": client_ip,
-                },
-            )
+        start_ns = g.get("start_ns")
+        if start_ns is None or not logger.isEnabledFor(logging.INFO):
+            return response
+
+        # Integer microseconds: no float conversion or rounding per request
+        elapsed_us = (perf_counter_ns() - start_ns) // 1000
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        client_ip = forwarded_for.partition(",")[0].strip() if forwarded_for else (request.remote_addr or "unknown")
+        logger.info(
+            "Request completed",
+            extra={
+                "http_method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                "duration_us": elapsed_us,
+                "client_ip": client_ip,
+            },
+        )
+        return response
+
+
+def _register_cors(app: Flask, frontend_origin: str) -> None:
+    """Allow cookie-based API calls from the single frontend origin; other origins get no CORS headers."""
+    # Built once; the same header tuple is attached to every response
+    cors_headers = (
+        ("Access-Control-Allow-Origin", frontend_origin),
+        ("Access-Control-Allow-Credentials", "true"),
+        ("Access-Control-Allow-Headers", "Content-Type"),
+        ("Access-Control-Allow-Methods", "GET,POST,PUT,PATCH,DELETE,OPTIONS"),
+    )
+
+    @app.before_request
+    def answer_preflight() -> Response | None:
+        """Answer the frontend's OPTIONS preflights directly; the CORS headers are added in after_request."""
+        if request.method == "OPTIONS" and request.headers.get("Origin") == frontend_origin:
+            return app.response_class(status=204)
+        return None
+
+    @app.after_request
+    def add_cors_headers(response: Response) -> Response:
+        # Headers depend on the request's Origin, so shared caches must key on it
+        response.vary.add("Origin")
+        if request.headers.get("Origin") == frontend_origin:
+            response.headers.extend(cors_headers)
         return response
 
 
 def _register_session_hooks(app: Flask) -> None:
     @app.teardown_appcontext
     def cleanup_session(exception: BaseException | None) -> None:
-        from .database import _session_factory
-
+        # Sessions are created lazily by get_session(), so requests that never touched
+        # the database (health checks without DB, CORS preflights, 404s) have nothing to clean up
         session = g.pop("db_session", None)
         if session is None:
-            if _session_factory is not None:
-                _session_factory.remove()
             return
 
         try:
@@ -100,8 +135,25 @@ def _register_session_hooks(app: Flask) -> None:
             raise
         finally:
             session.close()
-            if _session_factory is not None:
-                _session_factory.remove()
+
+
+def _register_cli_commands(app: Flask) -> None:
+    @app.cli.command("init-admin")
+    def init_admin() -> None:
+        """Create the admin user from ADMIN_EMAIL / ADMIN_PASSWORD_HASH (run once per deployment)."""
+        # Imported here so workers and tests never load the script
+        from scripts.create_admin import create_admin_user
+
+        create_admin_user()
+
+    @app.cli.command("purge-refresh-tokens")
+    def purge_refresh_tokens() -> None:
+        """Delete expired and revoked refresh tokens (run periodically, e.g. daily)."""
+        # expires_at is stored as naive UTC
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None)
+        with session_scope() as session:
+            deleted = RefreshTokenRepository(session).purge_unusable(cutoff)
+        app.logger.info("Purged %d expired or revoked refresh tokens", deleted)
 
 
 def create_app() -> Flask:
@@ -117,18 +169,16 @@ def create_app() -> Flask:
         is_testing=app.config.get("TESTING", False),
     )
 
-    app.logger.info(f"Starting application in {app.config['FLASK_ENV']} mode")
+    app.logger.info("Starting application in %s mode", app.config["FLASK_ENV"])
 
     # Setup CORS for cookie-based authentication
+    # An empty FRONTEND_URL (same-origin deployments) skips the CORS hooks entirely
     frontend_origin = os.getenv("FRONTEND_URL", "http://localhost:5173")
-    CORS(
-        app,
-        supports_credentials=True,
-        origins=[frontend_origin],
-        allow_headers=["Content-Type"],
-        methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    )
-    app.logger.info(f"CORS enabled for origin: {frontend_origin}")
+    if frontend_origin:
+        _register_cors(app, frontend_origin)
+        app.logger.info("CORS enabled for origin: %s", frontend_origin)
+    else:
+        app.logger.info("CORS disabled (FRONTEND_URL is empty)")
 
     # Initialize rate limiter with Redis backend
     init_limiter(app)
@@ -137,16 +187,10 @@ def create_app() -> Flask:
     app.extensions["sqlalchemy_engine"] = get_engine()
     app.extensions["sqlalchemy_session_factory"] = get_session_factory()
 
-    # Create admin user from environment variables
-    # This must be called after init_engine() to ensure database connection is ready
-    # Automatically skips in test environment (FLASK_ENV=testing)
-    from scripts.create_admin import create_admin_user
-
-    create_admin_user()
-
     _register_error_handlers(app)
     _register_request_hooks(app)
     _register_session_hooks(app)
+    _register_cli_commands(app)
 
     app.register_blueprint(api_bp)
     app.logger.info("API blueprint registered: /api")
@@ -14,7 +14,8 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
     __table_args__ = (
         Index("idx_refresh_tokens_token", "token", unique=True),
-        Index("idx_refresh_tokens_user_id", "user_id"),
+        # Covers "active tokens for a user" (revoke all) and the user_id foreign key
+        Index("idx_refresh_tokens_user_revoked", "user_id", "is_revoked"),
         Index("idx_refresh_tokens_expires_at", "expires_at"),
         {"sqlite_autoincrement": True},
     )
@@ -42,11 +43,12 @@ class RefreshToken(Base):
         nullable=False,
         server_default=func.now(),
     )
+    # No onupdate: revocation is the only update, and SQLAlchemy would add updated_at=now()
+    # to every UPDATE. MySQL still maintains it via ON UPDATE CURRENT_TIMESTAMP (see 001_init.sql).
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
     )
 
     # Relationships
@@ -16,6 +16,8 @@ class SchemaMigration(Base):
         Index("idx_schema_migrations_filename", "filename", unique=True),
         {"sqlite_autoincrement": True},
     )
+    # Rows are only inserted by apply_sql_migrations.py; applied_at is never read back right after insert
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[int] = mapped_column(
         BigInteger().with_variant(Integer, "sqlite"),
@@ -4,13 +4,37 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from sqlalchemy import bindparam, delete, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.models.refresh_token import RefreshToken
 
+# Statements are built once at import; values are passed as bound parameters per call
+_FIND_BY_TOKEN = select(RefreshToken).where(RefreshToken.token == bindparam("token")).limit(1)
+# One UPDATE without reconciling the identity map (no SELECT of the affected primary keys);
+# "user_id" is reserved for the SET clause of an UPDATE on this table, hence b_user_id
+_REVOKE_ALL_FOR_USER = (
+    update(RefreshToken)
+    .where(RefreshToken.user_id == bindparam("b_user_id"), RefreshToken.is_revoked.is_(False))
+    .values(is_revoked=True)
+    .execution_options(synchronize_session=False)
+)
+# Revoked or expired rows are never accepted again, so they only bloat the indexes
+_PURGE_UNUSABLE = (
+    delete(RefreshToken)
+    .where(or_(RefreshToken.expires_at < bindparam("cutoff"), RefreshToken.is_revoked.is_(True)))
+    .execution_options(synchronize_session=False)
+)
+
 
 class RefreshTokenRepository:
-    """Repository for RefreshToken model database operations."""
+    """Repository for RefreshToken model database operations.
+
+    Writes are flushed, not committed; the calling service owns the transaction.
+    """
+
+    # Repositories are created for every service instance, so skip the per-instance __dict__
+    __slots__ = ("session",)
 
     def __init__(self, session: Session):
         """Initialize repository with database session."""
@@ -30,8 +54,7 @@ class RefreshTokenRepository:
         """
         refresh_token = RefreshToken(token=token, user_id=user_id, expires_at=expires_at, is_revoked=False)
         self.session.add(refresh_token)
-        self.session.commit()
-        self.session.refresh(refresh_token)
+        self.session.flush()
         return refresh_token
 
     def find_by_token(self, token: str) -> RefreshToken | None:
@@ -44,7 +67,7 @@ class RefreshTokenRepository:
         Returns:
             RefreshToken if found, None otherwise
         """
-        return self.session.query(RefreshToken).filter(RefreshToken.token == token).first()
+        return self.session.scalar(_FIND_BY_TOKEN, {"token": token})
 
     def revoke(self, token: str) -> bool:
         """
@@ -58,28 +81,47 @@ class RefreshTokenRepository:
         """
         refresh_token = self.find_by_token(token)
         if refresh_token:
-            refresh_token.is_revoked = True
-            self.session.commit()
+            self.revoke_record(refresh_token)
             return True
         return False
 
+    def revoke_record(self, refresh_token: RefreshToken) -> None:
+        """
+        Revoke a refresh token that is already loaded, without looking it up again.
+
+        Args:
+            refresh_token: RefreshToken instance to revoke
+        """
+        refresh_token.is_revoked = True
+        self.session.flush()
+
     def revoke_all_for_user(self, user_id: int) -> int:
         """
         Revoke all refresh tokens for a user.
 
+        RefreshToken objects already loaded in the session are not updated.
+
         Args:
             user_id: User ID whose tokens should be revoked
 
         Returns:
             Number of tokens revoked
         """
-        count = (
-            self.session.query(RefreshToken)
-            .filter(RefreshToken.user_id == user_id, RefreshToken.is_revoked.is_(False))
-            .update({RefreshToken.is_revoked: True})
-        )
-        self.session.commit()
-        return count
+        result = self.session.execute(_REVOKE_ALL_FOR_USER, {"b_user_id": user_id})
+        return result.rowcount  # type: ignore[attr-defined]
+
+    def purge_unusable(self, cutoff: datetime) -> int:
+        """
+        Delete refresh tokens that expired before cutoff or have been revoked.
+
+        Args:
+            cutoff: Tokens with expires_at earlier than this are deleted
+
+        Returns:
+            Number of tokens deleted
+        """
+        result = self.session.execute(_PURGE_UNUSABLE, {"cutoff": cutoff})
+        return result.rowcount  # type: ignore[attr-defined]
 
 
 __all__ = ["RefreshTokenRepository"]
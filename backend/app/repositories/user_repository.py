@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from datetime import datetime
+from typing import Literal, Sequence
 
+from sqlalchemy import Row, bindparam, or_, select
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 
+# Statements are built once at import; values are passed as bound parameters per call
+_FIND_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+# The email column is unique, so this returns at most two rows: the user and the email's owner
+_FIND_BY_ID_OR_EMAIL = select(User).where(or_(User.id == bindparam("user_id"), User.email == bindparam("email")))
+# Column-only select: rows skip ORM instance creation and never load password_hash
+_FIND_ALL_ROWS = select(User.id, User.email, User.role, User.name, User.created_at).order_by(User.created_at.asc())
+
 
 class UserRepository:
     """Repository for User model database operations."""
 
+    # Repositories are created for every service instance, so skip the per-instance __dict__
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         """Initialize repository with database session."""
         self.session = session
@@ -26,7 +38,7 @@ class UserRepository:
         Returns:
             User if found, None otherwise
         """
-        return self.session.query(User).filter(User.email == email).first()
+        return self.session.scalar(_FIND_BY_EMAIL, {"email": email})
 
     def find_by_id(self, user_id: int) -> User | None:
         """
@@ -38,29 +50,37 @@ class UserRepository:
         Returns:
             User if found, None otherwise
         """
-        return self.session.query(User).filter(User.id == user_id).first()
+        # Checks the session's identity map first and only queries on a miss
+        return self.session.get(User, user_id)
 
-    def find_by_email_excluding_id(self, email: str, user_id: int) -> User | None:
+    def find_by_id_with_email_owner(self, user_id: int, email: str) -> tuple[User | None, User | None]:
         """
-        Find a user by email address excluding a specific user ID.
+        Find a user by ID and any other user that already has an email address, in one query.
 
         Args:
-            email: Email address to search for
-            user_id: User ID to exclude from search
+            user_id: User ID to search for
+            email: Email address to check
 
         Returns:
-            User if found (excluding the specified user), None otherwise
+            Tuple of (user with user_id or None, other user with the email or None)
         """
-        return self.session.query(User).filter(User.email == email, User.id != user_id).first()
-
-    def find_all(self) -> Sequence[User]:
+        user: User | None = None
+        email_owner: User | None = None
+        for found in self.session.scalars(_FIND_BY_ID_OR_EMAIL, {"user_id": user_id, "email": email}):
+            if found.id == user_id:
+                user = found
+            else:
+                email_owner = found
+        return user, email_owner
+
+    def find_all_rows(self) -> Sequence[Row[tuple[int, str, Literal["admin", "user"], str | None, datetime]]]:
         """
-        Find all users ordered by created_at.
+        Find all users ordered by created_at, as read-only rows.
 
         Returns:
-            Sequence of all User instances
+            Sequence of rows with id, email, role, name and created_at
         """
-        return self.session.query(User).order_by(User.created_at.asc()).all()
+        return self.session.execute(_FIND_ALL_ROWS).all()
 
     def create(self, email: str, password_hash: str, role: str = "user", name: str | None = None) -> User:
         """
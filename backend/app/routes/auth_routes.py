@@ -4,20 +4,47 @@ from __future__ import annotations
 
 import logging
 import os
+from typing import Any
 
-from flask import Blueprint, jsonify, make_response, request
-from pydantic import ValidationError
+from flask import Blueprint, Response, jsonify, make_response, request
+from pydantic import TypeAdapter, ValidationError
 from werkzeug.exceptions import Unauthorized
 
 from app.database import get_session
-from app.limiter import limiter
-from app.schemas.auth import LoginRequest, LogoutResponse, RefreshTokenResponse
+from app.limiter import limiter, local_limiter
+from app.schemas.auth import LoginRequest, LogoutResponse, RefreshTokenResponse, UserResponse
 from app.services.auth_service import AuthService
 
 logger = logging.getLogger(__name__)
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
+# Cookie settings are read once at import (app.config has already loaded .env) instead of per request
+_COOKIE_SECURE = os.getenv("COOKIE_SECURE", "false").lower() == "true"
+_COOKIE_DOMAIN = os.getenv("COOKIE_DOMAIN", None)
+_ACCESS_TOKEN_MAX_AGE = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440")) * 60  # Convert to seconds
+_REFRESH_TOKEN_MAX_AGE = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")) * 24 * 60 * 60  # Convert to seconds
+
+# set_cookie() keyword arguments shared by every auth cookie; max_age is added per cookie
+_AUTH_COOKIE_KWARGS: dict[str, Any] = {"httponly": True, "samesite": "Lax", "path": "/api", "domain": _COOKIE_DOMAIN}
+_ACCESS_COOKIE_KWARGS: dict[str, Any] = {**_AUTH_COOKIE_KWARGS, "secure": _COOKIE_SECURE, "max_age": _ACCESS_TOKEN_MAX_AGE}
+_REFRESH_COOKIE_KWARGS: dict[str, Any] = {**_AUTH_COOKIE_KWARGS, "secure": _COOKIE_SECURE, "max_age": _REFRESH_TOKEN_MAX_AGE}
+_CLEAR_COOKIE_KWARGS: dict[str, Any] = {**_AUTH_COOKIE_KWARGS, "max_age": 0}
+
+# Built once so login validation reuses the compiled validator instead of resolving it per call
+_LOGIN_ADAPTER = TypeAdapter(LoginRequest)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Join pydantic errors into a single "field: message" string."""
+    return "; ".join(f"{err['loc'][0] if err['loc'] else 'unknown'}: {err['msg']}" for err in error.errors())
+
+
+def _set_auth_cookies(response: Response, access_token: str, refresh_token: str) -> None:
+    """Set the httpOnly access and refresh token cookies on response."""
+    response.set_cookie("access_token", value=access_token, **_ACCESS_COOKIE_KWARGS)
+    response.set_cookie("refresh_token", value=refresh_token, **_REFRESH_COOKIE_KWARGS)
+
 
 @auth_bp.post("/login")
 @limiter.limit("10 per minute")  # Rate limit: 10 login attempts per minute per IP
@@ -45,11 +72,11 @@ def login():
     """
     try:
         # Parse and validate request
-        payload = request.get_json()
+        payload = request.get_json(cache=False)
         if not payload:
             raise ValueError("Request body is required")
 
-        data = LoginRequest.model_validate(payload)
+        data = _LOGIN_ADAPTER.validate_python(payload)
 
         # Perform login
         session = get_session()
@@ -60,55 +87,25 @@ def login():
         response = make_response(jsonify(response_data.model_dump()), 200)
 
         # Set cookies
-        cookie_secure = os.getenv("COOKIE_SECURE", "false").lower() == "true"
-        cookie_domain = os.getenv("COOKIE_DOMAIN", None)
-
-        access_token_max_age = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440")) * 60  # Convert to seconds
-        refresh_token_max_age = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")) * 24 * 60 * 60  # Convert to seconds
-
-        response.set_cookie(
-            "access_token",
-            value=access_token,
-            max_age=access_token_max_age,
-            httponly=True,
-            secure=cookie_secure,
-            samesite="Lax",
-            path="/api",
-            domain=cookie_domain,
-        )
-
-        response.set_cookie(
-            "refresh_token",
-            value=refresh_token,
-            max_age=refresh_token_max_age,
-            httponly=True,
-            secure=cookie_secure,
-            samesite="Lax",
-            path="/api",
-            domain=cookie_domain,
-        )
-
-        logger.info(f"Login successful: {data.email}")
+        _set_auth_cookies(response, access_token, refresh_token)
+
+        logger.info("Login successful: %s", data.email)
         return response
 
     except ValidationError as e:
-        logger.warning(f"Validation error during login: {e}")
-        error_messages = []
-        for error in e.errors():
-            field = error["loc"][0] if error["loc"] else "unknown"
-            message = error["msg"]
-            error_messages.append(f"{field}: {message}")
-        return jsonify({"error": "; ".join(error_messages)}), 400
+        logger.warning("Validation error during login: %s", str(e))
+        return jsonify({"error": _format_validation_error(e)}), 400
     except ValueError as e:
-        logger.warning(f"Login error: {e}")
+        logger.warning("Login error: %s", str(e))
         return jsonify({"error": str(e)}), 401
     except Exception as e:
-        logger.error(f"Unexpected error during login: {e}", exc_info=True)
+        logger.error("Unexpected error during login: %s", str(e), exc_info=True)
         return jsonify({"error": "ログインに失敗しました"}), 500
 
 
 @auth_bp.post("/refresh")
-@limiter.limit("30 per minute")  # Rate limit: 30 token refreshes per minute per IP
+@limiter.exempt
+@local_limiter.limit(30)  # Rate limit: 30 token refreshes per minute per IP, counted per worker process
 def refresh():
     """
     Refresh access token endpoint.
@@ -141,57 +138,30 @@ def refresh():
         new_access_token, new_refresh_token, user = auth_service.refresh_access_token(refresh_token)
 
         # Create response with user information
-        from app.schemas.auth import UserResponse
-
         user_response = UserResponse.model_validate(user, from_attributes=True)
         response_data = RefreshTokenResponse(message="トークンを更新しました", user=user_response)
         response = make_response(jsonify(response_data.model_dump()), 200)
 
         # Set cookies
-        cookie_secure = os.getenv("COOKIE_SECURE", "false").lower() == "true"
-        cookie_domain = os.getenv("COOKIE_DOMAIN", None)
-
-        access_token_max_age = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440")) * 60
-        refresh_token_max_age = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")) * 24 * 60 * 60
-
-        response.set_cookie(
-            "access_token",
-            value=new_access_token,
-            max_age=access_token_max_age,
-            httponly=True,
-            secure=cookie_secure,
-            samesite="Lax",
-            path="/api",
-            domain=cookie_domain,
-        )
-
-        response.set_cookie(
-            "refresh_token",
-            value=new_refresh_token,
-            max_age=refresh_token_max_age,
-            httponly=True,
-            secure=cookie_secure,
-            samesite="Lax",
-            path="/api",
-            domain=cookie_domain,
-        )
+        _set_auth_cookies(response, new_access_token, new_refresh_token)
 
         logger.info("Token refresh successful")
         return response
 
     except ValueError as e:
-        logger.warning(f"Token refresh error: {e}")
+        logger.warning("Token refresh error: %s", str(e))
         return jsonify({"error": str(e)}), 401
     except Unauthorized as e:
-        logger.warning(f"Token refresh unauthorized: {e}")
+        logger.warning("Token refresh unauthorized: %s", str(e))
         return jsonify({"error": str(e.description)}), 401
     except Exception as e:
-        logger.error(f"Unexpected error during token refresh: {e}", exc_info=True)
+        logger.error("Unexpected error during token refresh: %s", str(e), exc_info=True)
         return jsonify({"error": "トークンの更新に失敗しました"}), 500
 
 
 @auth_bp.post("/logout")
-@limiter.limit("20 per minute")  # Rate limit: 20 logout requests per minute per IP
+@limiter.exempt
+@local_limiter.limit(20)  # Rate limit: 20 logout requests per minute per IP, counted per worker process
 def logout():
     """
     Logout endpoint.
@@ -218,20 +188,17 @@ def logout():
 
         # Create response
         response_data = LogoutResponse(message="ログアウトしました")
-        response = make_response(jsonify(response_data.model_dump()), 200)
+        response = Response(response_data.model_dump_json(), status=200, mimetype="application/json")
 
         # Clear cookies by setting max_age=0
-        cookie_domain = os.getenv("COOKIE_DOMAIN", None)
-
-        response.set_cookie("access_token", value="", max_age=0, httponly=True, samesite="Lax", path="/api", domain=cookie_domain)
-
-        response.set_cookie("refresh_token", value="", max_age=0, httponly=True, samesite="Lax", path="/api", domain=cookie_domain)
+        response.set_cookie("access_token", value="", **_CLEAR_COOKIE_KWARGS)
+        response.set_cookie("refresh_token", value="", **_CLEAR_COOKIE_KWARGS)
 
         logger.info("Logout successful")
         return response
 
     except Exception as e:
-        logger.error(f"Unexpected error during logout: {e}", exc_info=True)
+        logger.error("Unexpected error during logout: %s", str(e), exc_info=True)
         return jsonify({"error": "ログアウトに失敗しました"}), 500
 
 
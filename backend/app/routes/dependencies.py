@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, TypeVar
 
 from flask import g, request
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from werkzeug.exceptions import BadRequest, Conflict, Forbidden, InternalServerError, NotFound
 
 from app.database import get_session
@@ -56,19 +56,28 @@ def with_user_service(func: RouteCallable) -> RouteCallable:
     return wrapper  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=64)
+def _type_adapter(schema: type[SchemaType]) -> TypeAdapter[SchemaType]:
+    """Return a TypeAdapter for schema, built once per schema class."""
+
+    return TypeAdapter(schema)
+
+
 def validate_request_body(schema: type[SchemaType]) -> Callable[[RouteCallable], RouteCallable]:
     """Validate JSON request body with given schema and pass it to the route."""
 
+    adapter = _type_adapter(schema)
+
     def decorator(func: RouteCallable) -> RouteCallable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any):
-            payload = request.get_json()
+            payload = request.get_json(cache=False)
             if not payload:
                 logger.warning("Validation failed: request body is required", extra={"path": request.path})
                 raise BadRequest(description="Request body is required")
 
             try:
-                data = schema.model_validate(payload)
+                data = adapter.validate_python(payload)
             except ValidationError as exc:
                 messages = ", ".join(err.get("msg", "Invalid value") for err in exc.errors())
                 logger.warning("Validation failed for request body", extra={"path": request.path, "messages": messages})
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import time
+from functools import lru_cache
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 from sqlalchemy import text
 
 from app.database import get_session
@@ -14,6 +17,17 @@ logger = logging.getLogger(__name__)
 
 health_bp = Blueprint("health", __name__)
 
+# A successful SELECT 1 is trusted for this many seconds so frequent probes do not hit the database each time
+_DB_CHECK_INTERVAL_SECONDS = 5.0
+# time.monotonic() of the last successful database check; None forces a check
+_last_db_ok: float | None = None
+
+
+@lru_cache(maxsize=4)
+def _healthy_body(version: str) -> bytes:
+    """Serialize the healthy response once per APP_VERSION instead of through jsonify on every probe."""
+    return json.dumps({"status": "healthy", "database": "connected", "version": version}, separators=(",", ":")).encode()
+
 
 @health_bp.get("/health")
 def health_check():
@@ -22,6 +36,7 @@ def health_check():
 
     Returns:
         JSON response with status, database connection status, and application version.
+        A successful database check is reused for _DB_CHECK_INTERVAL_SECONDS; failures are never cached.
         - 200: Application is healthy
         - 503: Application is unhealthy (database connection failed)
 
@@ -32,16 +47,24 @@ def health_check():
             "version": "v1.0.0"
         }
     """
+    global _last_db_ok
+
     # Get version from environment variable, default to "unknown"
     version = os.environ.get("APP_VERSION", "unknown")
 
+    now = time.monotonic()
+    if _last_db_ok is not None and now - _last_db_ok < _DB_CHECK_INTERVAL_SECONDS:
+        return current_app.response_class(_healthy_body(version), status=200, mimetype="application/json")
+
     try:
         # Check database connection
         with get_session() as session:
             session.execute(text("SELECT 1"))
 
-        return jsonify({"status": "healthy", "database": "connected", "version": version}), 200
+        _last_db_ok = now
+        return current_app.response_class(_healthy_body(version), status=200, mimetype="application/json")
 
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        _last_db_ok = None
+        logger.error("Health check failed: %s", str(e))
         return jsonify({"status": "unhealthy", "database": "disconnected", "version": version, "error": str(e)}), 503
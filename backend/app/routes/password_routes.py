@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import logging
 
-from flask import Blueprint, g, jsonify, request
-from pydantic import ValidationError
+from flask import Blueprint, Response, g, jsonify, request
+from pydantic import TypeAdapter, ValidationError
 
 from app.database import get_session
 from app.schemas.password import PasswordChangeRequest, PasswordChangeResponse, PasswordValidationError
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 password_bp = Blueprint("password", __name__, url_prefix="/password")
 
+_PASSWORD_CHANGE_ADAPTER = TypeAdapter(PasswordChangeRequest)
+
 
 @password_bp.post("/change")
 @require_auth
@@ -40,20 +42,20 @@ def change_password():
     user_id = g.user_id
 
     # Parse and validate request
-    payload = request.get_json()
+    payload = request.get_json(cache=False)
     if not payload:
         logger.warning("POST /api/password/change - Request body is required")
         return jsonify({"error": "Request body is required"}), 400
 
     try:
-        data = PasswordChangeRequest.model_validate(payload)
+        data = _PASSWORD_CHANGE_ADAPTER.validate_python(payload)
     except ValidationError as e:
-        logger.warning(f"POST /api/password/change - Validation error: {e}")
+        logger.warning("POST /api/password/change - Validation error: %s", str(e))
         # Extract error messages from Pydantic validation errors
         errors = [{"field": err["loc"][0] if err["loc"] else "unknown", "message": err["msg"]} for err in e.errors()]
         return jsonify({"error": "Validation error", "details": errors}), 400
     except PasswordValidationError as e:
-        logger.warning(f"POST /api/password/change - Validation error: {e}")
+        logger.warning("POST /api/password/change - Validation error: %s", str(e))
         return jsonify({"error": str(e)}), 400
 
     # Change password
@@ -66,8 +68,8 @@ def change_password():
     )
 
     response = PasswordChangeResponse(message="パスワードを変更しました")
-    logger.info(f"POST /api/password/change - Password changed successfully for user_id={user_id}")
-    return jsonify(response.model_dump()), 200
+    logger.info("POST /api/password/change - Password changed successfully for user_id=%s", user_id)
+    return Response(response.model_dump_json(), status=200, mimetype="application/json")
 
 
 __all__ = ["password_bp"]
@@ -43,7 +43,7 @@ def list_users(*, user_service: UserService):
     users = user_service.list_users()
 
     response = UserListResponse(users=users)
-    logger.info(f"GET /api/users - Retrieved {len(users)} users successfully")
+    logger.info("GET /api/users - Retrieved %d users successfully", len(users))
     return jsonify(response.model_dump()), 200
 
 
@@ -78,7 +78,7 @@ def create_user(*, data: UserCreateRequest, user_service: UserService):
 
     result = user_service.create_user(email=data.email, name=data.name)
 
-    logger.info(f"POST /api/users - User created successfully: {data.email} (id={result.user.id})")
+    logger.info("POST /api/users - User created successfully: %s (id=%s)", data.email, result.user.id)
     return jsonify(result.model_dump()), 201
 
 
@@ -108,7 +108,7 @@ def update_current_user(*, data: UserUpdateRequest, user_service: UserService):
         }
     """
     user_id = g.user_id
-    logger.info(f"PATCH /api/users/me - Updating profile for user_id={user_id}")
+    logger.info("PATCH /api/users/me - Updating profile for user_id=%s", user_id)
 
     updated_user = user_service.update_user_profile(user_id=user_id, email=data.email, name=data.name)
 
@@ -134,11 +134,11 @@ def delete_user(user_id: int, *, user_service: UserService):
     Returns:
         204 No Content on success
     """
-    logger.info(f"DELETE /api/users/{user_id} - Deleting user")
+    logger.info("DELETE /api/users/%s - Deleting user", user_id)
 
     user_service.delete_user(user_id)
 
-    logger.info(f"DELETE /api/users/{user_id} - User deleted successfully")
+    logger.info("DELETE /api/users/%s - User deleted successfully", user_id)
     return "", 204
 
 
@@ -50,12 +50,12 @@ class AuthService:
         # Find user by email
         user = self.user_repo.find_by_email(email)
         if not user:
-            logger.warning(f"Login failed: user not found - {email}")
+            logger.warning("Login failed: user not found - %s", email)
             raise ValueError("メールアドレスまたはパスワードが間違っています")
 
         # Verify password
         if not verify_password(password, user.password_hash):
-            logger.warning(f"Login failed: invalid password - {email}")
+            logger.warning("Login failed: invalid password - %s", email)
             raise ValueError("メールアドレスまたはパスワードが間違っています")
 
         # Generate tokens
@@ -65,8 +65,9 @@ class AuthService:
         # Store refresh token in database
         expires_at = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
         self.refresh_token_repo.create(token=refresh_token, user_id=user.id, expires_at=expires_at)
+        self.session.commit()
 
-        logger.info(f"User logged in successfully: {email} (id={user.id}, role={user.role})")
+        logger.info("User logged in successfully: %s (id=%s, role=%s)", email, user.id, user.role)
 
         response = LoginResponse(user=UserResponse(id=user.id, email=user.email, role=user.role, name=user.name, created_at=user.created_at))
         return response, access_token, refresh_token
@@ -95,11 +96,11 @@ class AuthService:
             # Check if refresh token exists in database and is not revoked
             token_record = self.refresh_token_repo.find_by_token(refresh_token)
             if not token_record:
-                logger.warning(f"Refresh token not found in database: user_id={user_id}")
+                logger.warning("Refresh token not found in database: user_id=%s", user_id)
                 raise ValueError("リフレッシュトークンが無効です")
 
             if token_record.is_revoked:
-                logger.warning(f"Refresh token is revoked: user_id={user_id}")
+                logger.warning("Refresh token is revoked: user_id=%s", user_id)
                 raise ValueError("リフレッシュトークンが無効です")
 
             # Compare timezone-aware datetimes (database returns naive datetime, treat as UTC)
@@ -107,27 +108,30 @@ class AuthService:
                 token_record.expires_at.replace(tzinfo=timezone.utc) if token_record.expires_at.tzinfo is None else token_record.expires_at
             )
             if expires_at_utc < datetime.now(timezone.utc):
-                logger.warning(f"Refresh token expired: user_id={user_id}")
+                logger.warning("Refresh token expired: user_id=%s", user_id)
                 raise ValueError("リフレッシュトークンが無効です")
 
             # Get user
             user = self.user_repo.find_by_id(user_id)
             if not user:
-                logger.warning(f"User not found during token refresh: user_id={user_id}")
+                logger.warning("User not found during token refresh: user_id=%s", user_id)
                 raise ValueError("リフレッシュトークンが無効です")
 
             # Generate new tokens
             new_access_token = self._generate_access_token(user.id, user.email, user.role)
             new_refresh_token = self._generate_refresh_token(user.id)
 
-            # Revoke old refresh token
-            self.refresh_token_repo.revoke(refresh_token)
+            # Revoke old refresh token (already loaded above, so no second lookup)
+            self.refresh_token_repo.revoke_record(token_record)
 
             # Store new refresh token
             expires_at = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
             self.refresh_token_repo.create(token=new_refresh_token, user_id=user.id, expires_at=expires_at)
 
-            logger.info(f"Access token refreshed for user: {user.email} (id={user.id}, role={user.role})")
+            # Revocation and the new token are committed together
+            self.session.commit()
+
+            logger.info("Access token refreshed for user: %s (id=%s, role=%s)", user.email, user.id, user.role)
 
             return new_access_token, new_refresh_token, user
 
@@ -135,7 +139,7 @@ class AuthService:
             logger.warning("Refresh token expired (JWT)")
             raise ValueError("リフレッシュトークンが無効です")
         except jwt.InvalidTokenError as e:
-            logger.warning(f"Invalid refresh token (JWT): {e}")
+            logger.warning("Invalid refresh token (JWT): %s", str(e))
             raise ValueError("リフレッシュトークンが無効です")
 
     def logout(self, refresh_token: str) -> None:
@@ -146,6 +150,7 @@ class AuthService:
             refresh_token: Refresh token to revoke
         """
         self.refresh_token_repo.revoke(refresh_token)
+        self.session.commit()
         logger.info("User logged out, refresh token revoked")
 
     def _generate_access_token(self, user_id: int, email: str, role: str) -> str:
@@ -52,13 +52,13 @@ class PasswordService:
             # Get user
             user = self.user_repo.find_by_id(user_id)
             if not user:
-                logger.warning(f"Password change failed: user not found - id={user_id}")
+                logger.warning("Password change failed: user not found - id=%s", user_id)
                 # Don't reveal whether user exists - use same error as invalid password
                 raise InvalidPasswordError()
 
             # Verify current password
             if not verify_password(current_password, user.password_hash):
-                logger.warning(f"Password change failed: invalid current password - user_id={user_id}")
+                logger.warning("Password change failed: invalid current password - user_id=%s", user_id)
                 raise InvalidPasswordError()
 
             # Hash new password
@@ -68,7 +68,7 @@ class PasswordService:
             user.password_hash = new_password_hash
             self.session.commit()
 
-            logger.info(f"Password changed successfully: user_id={user_id}, email={user.email}")
+            logger.info("Password changed successfully: user_id=%s, email=%s", user_id, user.email)
 
         except InvalidPasswordError:
             # Re-raise this specific error
@@ -76,7 +76,7 @@ class PasswordService:
             raise
         except Exception as e:
             self.session.rollback()
-            logger.error(f"Failed to change password for user {user_id}: {e}", exc_info=True)
+            logger.error("Failed to change password for user %s: %s", user_id, str(e), exc_info=True)
             raise PasswordServiceError(description="Failed to change password")
 
 
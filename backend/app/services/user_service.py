@@ -53,18 +53,18 @@ class UserService:
     def list_users(self) -> list[UserResponse]:
         """Get all users."""
         try:
-            users = self.user_repo.find_all()
-            logger.info(f"Retrieved {len(users)} users")
+            users = self.user_repo.find_all_rows()
+            logger.info("Retrieved %d users", len(users))
             return [UserResponse(id=user.id, email=user.email, role=user.role, name=user.name, created_at=user.created_at) for user in users]
         except Exception as exc:  # pragma: no cover - unexpected errors are logged and re-raised
-            logger.error(f"Failed to list users: {exc}", exc_info=True)
+            logger.error("Failed to list users: %s", str(exc), exc_info=True)
             raise UserServiceError("Failed to retrieve users") from exc
 
     def create_user(self, email: str, name: str) -> UserCreateResponse:
         """Create a new user with random initial password."""
         existing_user = self.user_repo.find_by_email(email)
         if existing_user:
-            logger.warning(f"User creation failed: email already exists - {email}")
+            logger.warning("User creation failed: email already exists - %s", email)
             raise UserAlreadyExistsError(email)
 
         initial_password = generate_initial_password()
@@ -77,23 +77,23 @@ class UserService:
             name=name,
         )
 
-        # Flush to assign IDs and load defaults without committing the transaction
+        # Flush to assign IDs without committing the transaction. Server defaults such as
+        # created_at come back via INSERT..RETURNING where supported, else load on first access
         self.session.flush()
-        self.session.refresh(user)
 
-        logger.info(f"User created successfully: {email} (id={user.id}, name={name})")
+        logger.info("User created successfully: %s (id=%s, name=%s)", email, user.id, name)
 
         user_response = UserResponse(id=user.id, email=user.email, role=user.role, name=user.name, created_at=user.created_at)
         return UserCreateResponse(user=user_response, initial_password=initial_password)
 
     def update_user_profile(self, user_id: int, email: str, name: str) -> UserResponse:
         """Update an existing user's profile information."""
-        user = self.user_repo.find_by_id(user_id)
+        # The user and any other owner of the new email are fetched in one round-trip
+        user, existing_user = self.user_repo.find_by_id_with_email_owner(user_id, email)
         if not user:
-            logger.warning(f"Profile update failed: user not found - id={user_id}")
+            logger.warning("Profile update failed: user not found - id=%s", user_id)
             raise UserNotFoundError(user_id)
 
-        existing_user = self.user_repo.find_by_email_excluding_id(email, user_id)
         if existing_user:
             logger.warning(
                 "Profile update failed: email already in use",
@@ -118,15 +118,15 @@ class UserService:
         """Delete a user by ID."""
         user = self.user_repo.find_by_id(user_id)
         if not user:
-            logger.warning(f"User deletion failed: user not found - id={user_id}")
+            logger.warning("User deletion failed: user not found - id=%s", user_id)
             raise UserNotFoundError(user_id)
 
         if user.role == "admin":
-            logger.warning(f"User deletion failed: cannot delete admin user - id={user_id}, email={user.email}")
+            logger.warning("User deletion failed: cannot delete admin user - id=%s, email=%s", user_id, user.email)
             raise CannotDeleteAdminError()
 
         self.user_repo.delete(user)
-        logger.info(f"User deleted successfully: id={user_id}, email={user.email}")
+        logger.info("User deleted successfully: id=%s, email=%s", user_id, user.email)
 
 
 __all__ = [
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from functools import wraps
 from typing import Any, Callable, Literal
 
@@ -13,6 +14,39 @@ from werkzeug.exceptions import Forbidden, Unauthorized
 
 logger = logging.getLogger(__name__)
 
+# Verified access-token payloads, keyed by the raw token: token -> (cache expiry epoch, payload).
+# Access tokens are not revoked server-side, so an entry stays valid until the token's own exp;
+# the short TTL only bounds how long a payload outlives a JWT_SECRET_KEY rotation.
+_PAYLOAD_CACHE_TTL_SECONDS = 30
+_PAYLOAD_CACHE_MAX_ENTRIES = 10_000
+_payload_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def _decode_access_token(access_token: str) -> dict[str, Any]:
+    """Decode and verify an access token, reusing the result for repeated requests with the same token.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or expired (failures are never cached)
+    """
+    now = time.time()
+    cached = _payload_cache.get(access_token)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    jwt_secret = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
+    jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+    payload = jwt.decode(access_token, jwt_secret, algorithms=[jwt_algorithm])
+
+    cache_until = now + _PAYLOAD_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)) and exp < cache_until:
+        cache_until = exp
+    if len(_payload_cache) >= _PAYLOAD_CACHE_MAX_ENTRIES:
+        # Entries are short-lived, so dropping them all is cheaper than tracking recency
+        _payload_cache.clear()
+    _payload_cache[access_token] = (cache_until, payload)
+    return payload
+
 
 def require_auth(f: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -36,9 +70,7 @@ def require_auth(f: Callable[..., Any]) -> Callable[..., Any]:
 
         try:
             # Decode and validate token
-            jwt_secret = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
-            jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-            payload = jwt.decode(access_token, jwt_secret, algorithms=[jwt_algorithm])
+            payload = _decode_access_token(access_token)
 
             # Extract user_id from payload
             user_id = payload.get("user_id")
@@ -59,7 +91,7 @@ def require_auth(f: Callable[..., Any]) -> Callable[..., Any]:
             logger.warning("Access token expired")
             raise Unauthorized("トークンの有効期限が切れています")
         except jwt.InvalidTokenError as e:
-            logger.warning(f"Invalid access token: {e}")
+            logger.warning("Rejected invalid JWT: %s", str(e))
             raise Unauthorized("認証が必要です")
 
     return decorated_function
@@ -102,7 +134,7 @@ def require_role(required_role: Literal["admin", "user"]) -> Callable[[Callable[
 
             # Check if user has required role
             if user_role != required_role:
-                logger.warning(f"Access denied: user has role '{user_role}' but '{required_role}' is required (user_id={g.user_id})")
+                logger.warning("Access denied: user has role '%s' but '%s' is required (user_id=%s)", user_role, required_role, g.user_id)
                 raise Forbidden("このリソースにアクセスする権限がありません")
 
             return f(*args, **kwargs)
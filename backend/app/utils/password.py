@@ -1,7 +1,14 @@
 """Password hashing utilities using bcrypt."""
 
+import os
+import threading
+
 import bcrypt
 
+# bcrypt releases the GIL, so concurrent request threads would all hash at once and
+# oversubscribe the CPU; at most one hash per core runs, the rest wait their turn
+_BCRYPT_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+
 
 def hash_password(password: str) -> str:
     """
@@ -15,7 +22,8 @@ def hash_password(password: str) -> str:
     """
     password_bytes = password.encode("utf-8")
     salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    with _BCRYPT_SLOTS:
+        hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
 
@@ -32,7 +40,8 @@ def verify_password(password: str, password_hash: str) -> bool:
     """
     password_bytes = password.encode("utf-8")
     hash_bytes = password_hash.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hash_bytes)
+    with _BCRYPT_SLOTS:
+        return bcrypt.checkpw(password_bytes, hash_bytes)
 
 
 __all__ = ["hash_password", "verify_password"]
@@ -24,6 +24,10 @@ if ! pgrep nginx > /dev/null; then
 fi
 echo "Nginx started successfully on port 5000"
 
+# Create the admin user once, before the workers start
+echo "Initializing admin user..."
+flask init-admin
+
 # Start Gunicorn in the foreground
 echo "Starting Gunicorn..."
 exec gunicorn \
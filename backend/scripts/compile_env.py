@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Compile backend/.env into an importable Python module.
+
+The generated module (app/_env_compiled.py) holds the .env values as a
+literal dict, so app/config.py can apply them without parsing the .env
+file on every process start. Re-run this script whenever .env changes;
+delete app/_env_compiled.py to go back to parsing .env directly.
+
+Usage:
+    poetry -C backend run python scripts/compile_env.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+backend_dir = Path(__file__).resolve().parent.parent
+ENV_PATH = backend_dir / ".env"
+OUTPUT_PATH = backend_dir / "app" / "_env_compiled.py"
+
+HEADER = '"""Generated by scripts/compile_env.py from backend/.env. Do not edit."""\n\n'
+
+
+def render_env_module(values: dict[str, str | None]) -> str:
+    """Render .env values as Python source defining an ``ENV`` dict.
+
+    Args:
+        values: Parsed .env key/value pairs (keys without a value are skipped)
+
+    Returns:
+        str: Python module source
+    """
+    lines = [HEADER, "ENV: dict[str, str] = {\n"]
+    for key, value in values.items():
+        if value is None:
+            continue
+        lines.append(f"    {key!r}: {value!r},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def compile_env(env_path: Path = ENV_PATH, output_path: Path = OUTPUT_PATH) -> int:
+    """Write the compiled module for env_path to output_path.
+
+    Args:
+        env_path: Source .env file
+        output_path: Destination Python module
+
+    Returns:
+        int: Number of variables written
+    """
+    values = dotenv_values(env_path)
+    output_path.write_text(render_env_module(values), encoding="utf-8")
+    return sum(1 for value in values.values() if value is not None)
+
+
+def main() -> None:
+    """Compile backend/.env into app/_env_compiled.py."""
+    if not ENV_PATH.exists():
+        print(f"Error: {ENV_PATH} not found", file=sys.stderr)
+        sys.exit(1)
+
+    count = compile_env()
+    print(f"Wrote {count} variables to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """Admin user creation script.
 
-This script creates an Admin user from environment variables at application startup.
-It is called automatically by app/main.py during the app initialization.
+This script creates an Admin user from environment variables at deployment startup.
+It is run once by the `flask init-admin` command (see app/main.py) before the server starts,
+not on every app initialization.
 
 Environment Variables:
     ADMIN_EMAIL: Email address for the admin user (required)
@@ -37,7 +38,7 @@ logger = logging.getLogger(__name__)
 def create_admin_user() -> None:
     """Create Admin user from environment variables.
 
-    This function should be called once at application startup.
+    This function should be called once at deployment startup (via `flask init-admin`).
     It reads ADMIN_EMAIL and ADMIN_PASSWORD_HASH (or ADMIN_PASSWORD) from environment variables
     and creates an admin user if it doesn't exist.
 
@@ -7,11 +7,15 @@ and improve test maintainability.
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import jwt
 from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from werkzeug.test import TestResponse
 
 
@@ -154,3 +158,28 @@ def assert_cookie_set(response: TestResponse, cookie_name: str, should_be_cleare
         # Find the specific cookie and check if it has max-age=0
         cookie_header = next((h for h in set_cookie_headers if cookie_name in h), "")
         assert "max-age=0" in cookie_header.lower(), f"Cookie '{cookie_name}' should be cleared (max-age=0), got: {cookie_header}"
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[list[str]]:
+    """Record the SQL statements executed on engine inside the block.
+
+    Use it to pin the number of queries a repository or endpoint issues, so an
+    N+1 pattern fails a test instead of reaching production.
+
+    Args:
+        engine: SQLAlchemy engine to listen on (e.g. app.database.get_engine())
+
+    Yields:
+        list[str]: Executed statements, in order; filled in as the block runs
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from app.database import get_engine, get_session
+from app.models.refresh_token import RefreshToken
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from tests.helpers import count_queries
+
+
+class TestRefreshTokenModel:
+    """Tests for RefreshToken model schema and update behavior."""
+
+    def test_user_revoked_composite_index(self):
+        """Test that user_id is indexed together with is_revoked instead of on its own."""
+        indexes = {index.name: [column.name for column in index.columns] for index in RefreshToken.__table__.indexes}
+
+        assert indexes["idx_refresh_tokens_user_revoked"] == ["user_id", "is_revoked"]
+        assert "idx_refresh_tokens_user_id" not in indexes
+
+    def test_revoke_does_not_write_updated_at(self, app: Flask, test_user: int):
+        """Test that revoking a token only updates is_revoked."""
+        with app.app_context():
+            repo = RefreshTokenRepository(get_session())
+            repo.create("revoke-me", test_user, datetime.now() + timedelta(days=1))
+
+            with count_queries(get_engine()) as statements:
+                assert repo.revoke("revoke-me") is True
+
+            updates = [statement for statement in statements if statement.startswith("UPDATE refresh_tokens")]
+            assert updates
+            assert all("updated_at" not in statement for statement in updates)
+
+    def test_repository_writes_are_left_uncommitted(self, app: Flask, test_user: int):
+        """Test that create() only flushes, so the caller's rollback discards the token."""
+        with app.app_context():
+            session = get_session()
+            repo = RefreshTokenRepository(session)
+            created = repo.create("uncommitted", test_user, datetime.now() + timedelta(days=1))
+            assert created.id is not None
+
+            session.rollback()
+
+            assert repo.find_by_token("uncommitted") is None
+
+    def test_revoke_all_for_user_issues_single_update(self, app: Flask, test_user: int):
+        """Test that revoke_all_for_user revokes active tokens with one UPDATE and no SELECT."""
+        with app.app_context():
+            session = get_session()
+            repo = RefreshTokenRepository(session)
+            expires_at = datetime.now() + timedelta(days=1)
+            repo.create("active-1", test_user, expires_at)
+            repo.create("active-2", test_user, expires_at)
+            repo.revoke("active-2")
+
+            with count_queries(get_engine()) as statements:
+                assert repo.revoke_all_for_user(test_user) == 1
+
+            assert len(statements) == 1
+            assert statements[0].startswith("UPDATE refresh_tokens")
+
+            session.expire_all()
+            assert repo.find_by_token("active-1").is_revoked is True
@@ -62,6 +62,14 @@ class TestRateLimiting:
             response = client.post("/api/auth/logout")
             assert response.status_code == 200
 
+    def test_logout_rate_limit_exceeded(self, client):
+        """Test that logout is limited in process to 20 requests per minute."""
+        status_codes = [client.post("/api/auth/logout").status_code for _ in range(21)]
+
+        assert status_codes[:20] == [200] * 20
+        assert status_codes[20] == 429
+        assert "リクエストが多すぎます" in client.post("/api/auth/logout").json["error"]
+
     @pytest.mark.skip(reason="Requires Redis and rate limiting enabled - skip in unit tests")
     def test_login_rate_limit_reset_after_window(self, client, test_user):
         """
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from scripts.compile_env import compile_env, render_env_module  # noqa: E402
+
+
+class TestCompileEnv:
+    """Tests for compiling .env into a Python module."""
+
+    def test_compile_env_round_trips_values(self, tmp_path):
+        """Test that the generated module reproduces the parsed .env values."""
+        env_path = tmp_path / ".env"
+        env_path.write_text('DATABASE_URL=mysql+pymysql://u:p@db/app\nQUOTED="it\'s \\"fine\\""\n# comment\nEMPTY=\n')
+        output_path = tmp_path / "_env_compiled.py"
+
+        count = compile_env(env_path, output_path)
+
+        namespace: dict[str, object] = {}
+        exec(output_path.read_text(), namespace)
+        assert count == 3
+        assert namespace["ENV"] == {
+            "DATABASE_URL": "mysql+pymysql://u:p@db/app",
+            "QUOTED": 'it\'s "fine"',
+            "EMPTY": "",
+        }
+
+    def test_render_env_module_skips_keys_without_value(self):
+        """Test that bare keys (no '=') are not emitted."""
+        source = render_env_module({"FLAG": None, "NAME": "value"})
+
+        namespace: dict[str, object] = {}
+        exec(source, namespace)
+        assert namespace["ENV"] == {"NAME": "value"}
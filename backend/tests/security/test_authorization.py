@@ -10,9 +10,11 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import jwt
 
+from app.utils import auth_decorator
 from tests.helpers import assert_response_error, create_auth_client
 
 # Authentication Requirement Tests
@@ -41,6 +43,19 @@ def test_authenticated_user_can_access_protected_endpoint(app, test_user):
     assert response.status_code != 401
 
 
+def test_repeated_requests_verify_access_token_once(app, test_user):
+    """Test that the same access token is verified once and then served from the payload cache."""
+    auth_decorator._payload_cache.clear()
+    auth_client = create_auth_client(app, test_user)
+
+    with patch("app.utils.auth_decorator.jwt.decode", wraps=jwt.decode) as decode:
+        for _ in range(3):
+            response = auth_client.post("/api/password/change", json={"current_password": "wrong_password", "new_password": "new123"})
+            assert response.status_code != 401
+
+    assert decode.call_count == 1
+
+
 # Token Security Tests
 
 
@@ -8,7 +8,9 @@ from datetime import datetime, timedelta, timezone
 import jwt
 import pytest
 
+from app.database import get_engine
 from app.services.auth_service import AuthService
+from tests.helpers import count_queries
 
 
 @pytest.fixture
@@ -59,6 +61,24 @@ def test_login_stores_refresh_token_in_database(app, test_user, auth_service):
         assert token_record.is_revoked is False
 
 
+def test_login_query_count(app, test_user, auth_service):
+    """Test that login reads the user and inserts the refresh token without extra queries."""
+    with app.app_context(), count_queries(get_engine()) as statements:
+        auth_service.login("test@example.com", "password123")
+
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "INSERT"]
+
+
+def test_refresh_access_token_query_count(app, test_user, auth_service):
+    """Test that a token refresh issues one lookup per entity and one write per token."""
+    _, _, refresh_token = auth_service.login("test@example.com", "password123")
+
+    with app.app_context(), count_queries(get_engine()) as statements:
+        auth_service.refresh_access_token(refresh_token)
+
+    assert len(statements) <= 4
+
+
 def test_login_generates_valid_jwt_access_token(app, test_user, auth_service):
     """Test that login generates a valid JWT access token."""
     _, access_token, _ = auth_service.login("test@example.com", "password123")
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import pytest
 
+from app.database import get_engine
 from app.services.user_service import CannotDeleteAdminError, UserAlreadyExistsError, UserNotFoundError, UserService
-from tests.helpers import create_user
+from tests.helpers import count_queries, create_user
 
 
 @pytest.fixture
@@ -67,6 +68,7 @@ def test_create_user_success(app, user_service):
     assert result.user.name == "New User"
     assert result.user.role == "user"
     assert result.user.id is not None
+    assert result.user.created_at is not None
 
     # Verify initial password format (12 chars, alphanumeric)
     password = result.initial_password
@@ -107,6 +109,47 @@ def test_create_user_always_creates_with_user_role(app, user_service):
     assert result.user.role == "user"
 
 
+# update_user_profile tests
+
+
+def test_update_user_profile_keeps_own_email(app, user_service):
+    """Test that submitting the user's current email is not treated as a conflict."""
+    user_id = create_user(app, email="user@example.com", password="password123", role="user", name="Old Name")
+
+    result = user_service.update_user_profile(user_id, email="user@example.com", name="New Name")
+
+    assert result.id == user_id
+    assert result.email == "user@example.com"
+    assert result.name == "New Name"
+
+
+def test_update_user_profile_checks_user_and_email_in_one_query(app, user_service):
+    """Test that the user lookup and the email uniqueness check share one SELECT."""
+    user_id = create_user(app, email="user@example.com", password="password123", role="user")
+
+    with count_queries(get_engine()) as statements:
+        user_service.update_user_profile(user_id, email="new@example.com", name="New Name")
+
+    assert len(statements) == 1
+
+
+def test_update_user_profile_email_taken_raises_error(app, user_service):
+    """Test that another user's email raises UserAlreadyExistsError."""
+    user_id = create_user(app, email="user@example.com", password="password123", role="user")
+    create_user(app, email="existing@example.com", password="password123", role="user")
+
+    with pytest.raises(UserAlreadyExistsError):
+        user_service.update_user_profile(user_id, email="existing@example.com", name="User")
+
+
+def test_update_user_profile_not_found_raises_error(app, user_service):
+    """Test that an unknown user ID raises UserNotFoundError even if the email exists."""
+    create_user(app, email="existing@example.com", password="password123", role="user")
+
+    with pytest.raises(UserNotFoundError):
+        user_service.update_user_profile(99999, email="existing@example.com", name="User")
+
+
 # delete_user tests
 
 
@@ -2,6 +2,16 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
+from app.routes import health
+
+
+@pytest.fixture(autouse=True)
+def reset_db_check_cache(monkeypatch) -> None:
+    """Start every test without a cached database check."""
+    monkeypatch.setattr(health, "_last_db_ok", None)
+
 
 def test_health_endpoint(client) -> None:
     """Test health endpoint returns basic status and database connection."""
@@ -56,3 +66,30 @@ def test_health_endpoint_db_error_with_version(client, monkeypatch) -> None:
         assert data["database"] == "disconnected"
         assert data["version"] == "v1.0.0-error-test"
         assert "error" in data
+
+
+def test_health_endpoint_reuses_recent_db_check(client) -> None:
+    """Test health endpoint skips SELECT 1 while the last successful check is fresh."""
+    assert client.get("/api/health").status_code == 200
+
+    with patch("app.routes.health.get_session") as mock_get_session:
+        response = client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.get_json()["database"] == "connected"
+    mock_get_session.assert_not_called()
+
+
+def test_health_endpoint_rechecks_after_interval(client, monkeypatch) -> None:
+    """Test health endpoint queries the database again once the cached check expires."""
+    assert client.get("/api/health").status_code == 200
+    monkeypatch.setattr(health, "_last_db_ok", health._last_db_ok - health._DB_CHECK_INTERVAL_SECONDS)
+
+    with patch("app.routes.health.get_session") as mock_get_session:
+        mock_session = mock_get_session.return_value.__enter__.return_value
+        mock_session.execute.side_effect = Exception("Database connection failed")
+
+        response = client.get("/api/health")
+
+    assert response.status_code == 503
+    assert health._last_db_ok is None
@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+import pytest
+import redis
+from limits.storage import RedisStorage, storage_from_string
+
+from app.limiter import (
+    LOCAL_DENY_SCHEME,
+    LOCAL_WINDOW_MAX_KEYS,
+    REDIS_POOL_MAX_CONNECTIONS,
+    LocalDenyCacheRedisStorage,
+    LocalFixedWindowLimiter,
+    get_limiter_storage_uri,
+    get_redis_connection_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_storage_uri_cache():
+    """Make each test resolve the storage URI from its own environment."""
+    get_limiter_storage_uri.cache_clear()
+    yield
+    get_limiter_storage_uri.cache_clear()
+
+
+def test_storage_uri_uses_memory_when_rate_limiting_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+    monkeypatch.setenv("REDIS_HOST", "redis")
+
+    assert get_limiter_storage_uri() == "memory://"
+
+
+def test_storage_uri_builds_redis_uri(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("REDIS_HOST", "redis")
+    monkeypatch.setenv("REDIS_PORT", "6380")
+    monkeypatch.setenv("REDIS_PASSWORD", "secret")
+
+    assert get_limiter_storage_uri() == "redis://:secret@redis:6380/0"
+
+
+def test_storage_uri_is_cached_until_cleared(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+    assert get_limiter_storage_uri() == "memory://"
+
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("REDIS_HOST", "redis")
+    monkeypatch.delenv("REDIS_PORT", raising=False)
+    monkeypatch.delenv("REDIS_PASSWORD", raising=False)
+    assert get_limiter_storage_uri() == "memory://"
+
+    get_limiter_storage_uri.cache_clear()
+    assert get_limiter_storage_uri() == "redis://redis:6379/0"
+
+
+def test_redis_connection_pool_is_shared_and_bounded():
+    get_redis_connection_pool.cache_clear()
+    try:
+        pool = get_redis_connection_pool("redis://redis:6379/0")
+
+        assert get_redis_connection_pool("redis://redis:6379/0") is pool
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.max_connections == REDIS_POOL_MAX_CONNECTIONS
+        assert pool.connection_kwargs["socket_keepalive"] is True
+    finally:
+        get_redis_connection_pool.cache_clear()
+
+
+def test_local_deny_scheme_uses_local_deny_cache_storage():
+    pool = redis.BlockingConnectionPool.from_url("redis://redis:6379/0")
+
+    assert isinstance(storage_from_string(f"{LOCAL_DENY_SCHEME}://redis:6379/0", connection_pool=pool), LocalDenyCacheRedisStorage)
+    # The limits library's own redis:// registration is left as it was
+    redis_storage = storage_from_string("redis://redis:6379/0", connection_pool=pool)
+    assert type(redis_storage) is RedisStorage
+
+
+def test_local_deny_cache_skips_redis_for_rejected_keys():
+    storage = LocalDenyCacheRedisStorage("redis://redis:6379/0", connection_pool=redis.BlockingConnectionPool.from_url("redis://redis:6379/0"))
+
+    with patch.object(RedisStorage, "acquire_entry", return_value=False) as acquire_entry, patch.object(RedisStorage, "clear"):
+        assert storage.acquire_entry("login/127.0.0.1", 10, 60) is False
+        assert storage.acquire_entry("login/127.0.0.1", 10, 60) is False
+        assert acquire_entry.call_count == 1
+
+        # Other keys and cleared keys still go to Redis
+        assert storage.acquire_entry("login/127.0.0.2", 10, 60) is False
+        storage.clear("login/127.0.0.1")
+        assert storage.acquire_entry("login/127.0.0.1", 10, 60) is False
+        assert acquire_entry.call_count == 3
+
+
+def test_local_deny_cache_does_not_cache_allowed_hits():
+    storage = LocalDenyCacheRedisStorage("redis://redis:6379/0", connection_pool=redis.BlockingConnectionPool.from_url("redis://redis:6379/0"))
+
+    with patch.object(RedisStorage, "acquire_entry", return_value=True) as acquire_entry:
+        assert storage.acquire_entry("login/127.0.0.1", 10, 60) is True
+        assert storage.acquire_entry("login/127.0.0.1", 10, 60) is True
+        assert acquire_entry.call_count == 2
+
+
+def test_local_fixed_window_rejects_hits_over_limit():
+    local = LocalFixedWindowLimiter()
+
+    assert [local.hit(("127.0.0.1", "auth.logout"), 2, 60) for _ in range(3)] == [True, True, False]
+    # Other clients and endpoints have their own windows
+    assert local.hit(("127.0.0.2", "auth.logout"), 2, 60) is True
+    assert local.hit(("127.0.0.1", "auth.refresh"), 2, 60) is True
+
+
+def test_local_fixed_window_resets_after_period():
+    local = LocalFixedWindowLimiter()
+
+    with patch("app.limiter.time.monotonic", side_effect=[0.0, 1.0, 60.0]):
+        assert local.hit(("127.0.0.1", "auth.logout"), 1, 60) is True
+        assert local.hit(("127.0.0.1", "auth.logout"), 1, 60) is False
+        assert local.hit(("127.0.0.1", "auth.logout"), 1, 60) is True
+
+
+def test_local_fixed_window_bounds_tracked_keys():
+    local = LocalFixedWindowLimiter()
+
+    for i in range(LOCAL_WINDOW_MAX_KEYS + 1):
+        local.hit((str(i), "auth.logout"), 1, 60)
+
+    assert len(local._windows) == 1
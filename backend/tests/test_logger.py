@@ -1,16 +1,26 @@
 import json
 import logging
+import logging.handlers
+import os
+import signal
+import subprocess
+import sys
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from flask import Flask, g
 
-from app.logger import JsonFormatter, SensitiveDataFilter, StructuredTextFormatter, setup_logging
+from app import logger as logger_module
+from app.logger import JsonFormatter, LazyRequestID, RequestIDFilter, SensitiveDataFilter, StructuredTextFormatter, _rotated_log_namer, setup_logging
 
 
 @pytest.fixture(autouse=True)
 def reset_logging():
     """Reset logging handlers after each test to avoid cross-contamination."""
     yield
+    logger_module._stop_queue_listener()
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         handler.close()
@@ -51,6 +61,72 @@ def test_sensitive_data_filter_masks_nested_data():
     assert nested_list[1]["auth_token"] == "***"
 
 
+def test_sensitive_data_filter_masks_rendered_message_not_template():
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg="Config loaded: secret=%s, rate=%d%%",
+        args=("s3cr3t", 5),
+        exc_info=None,
+    )
+
+    SensitiveDataFilter().filter(record)
+
+    assert record.getMessage() == "Config loaded: secret=*** rate=5%"
+    assert record.args is None
+
+
+def test_sensitive_data_filter_keeps_token_template_renderable():
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=10,
+        msg="Invalid access token: %s for %s",
+        args=("abc.def.ghi", "user@example.com"),
+        exc_info=None,
+    )
+
+    SensitiveDataFilter().filter(record)
+
+    assert record.getMessage() == "Invalid access token: *** for ***"
+    assert record.args is None
+
+
+def test_sensitive_data_filter_copies_only_structures_it_masks():
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg="Request completed",
+        args=(),
+        exc_info=None,
+    )
+    unchanged = {"path": "/api/users", "items": [1, 2, {"status": "ok"}]}
+    caller_owned = {"user": {"email": "user@example.com", "id": 1}, "tags": ["a", "b"]}
+    record.unchanged = unchanged
+    record.details = caller_owned
+
+    SensitiveDataFilter().filter(record)
+
+    assert record.unchanged is unchanged
+    assert record.details["user"]["email"] == "***"
+    assert record.details["tags"] is caller_owned["tags"]
+    assert caller_owned["user"]["email"] == "user@example.com"
+
+
+def test_sensitive_data_filter_masks_all_patterns_in_one_message():
+    sensitive_filter = SensitiveDataFilter()
+
+    masked = sensitive_filter._mask_string("token: abc123 api_key=xyz Authorization: Bearer abc.def secret=s3 user@example.com")
+
+    assert masked == "token: *** api_key=*** Authorization: Bearer *** secret=*** ***"
+    assert sensitive_filter._mask_string("Request completed") == "Request completed"
+
+
 def test_json_formatter_includes_extra_fields():
     record = logging.LogRecord(
         name="test.logger",
@@ -76,6 +152,50 @@ def test_json_formatter_includes_extra_fields():
     assert payload["duration_ms"] == 12.34
 
 
+def test_json_formatter_extra_data_does_not_override_standard_fields():
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=60,
+        msg="ユーザー作成",
+        args=(),
+        exc_info=None,
+    )
+    record.level = "overridden"
+    record.line = 0
+    record.user_id = 42
+
+    output = JsonFormatter().format(record)
+    payload = json.loads(output)
+
+    assert "ユーザー作成" in output
+    assert payload["level"] == "WARNING"
+    assert payload["line"] == 60
+    assert payload["user_id"] == 42
+
+
+def test_json_formatter_timestamp_has_millisecond_precision():
+    formatter = JsonFormatter()
+    created = time.mktime((2025, 10, 27, 12, 34, 56, 0, 0, -1))
+    timestamps = []
+    for msecs in (5, 250):
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname=__file__,
+            lineno=60,
+            msg="Request completed",
+            args=(),
+            exc_info=None,
+        )
+        record.created = created + msecs / 1000
+        record.msecs = msecs
+        timestamps.append(json.loads(formatter.format(record))["timestamp"])
+
+    assert timestamps == ["2025-10-27T12:34:56.005", "2025-10-27T12:34:56.250"]
+
+
 def test_structured_text_formatter_appends_extra_data():
     formatter = StructuredTextFormatter(fmt="%(levelname)s:%(message)s")
     record = logging.LogRecord(
@@ -95,6 +215,38 @@ def test_structured_text_formatter_appends_extra_data():
     assert output.startswith("INFO:Request completed")
     assert "http_method=POST" in output
     assert "status_code=201" in output
+    assert "taskName" not in output
+
+
+def test_structured_text_formatter_formats_each_record_once():
+    formatter = StructuredTextFormatter(fmt="%(levelname)s:%(message)s")
+    records = [
+        logging.LogRecord(name="test.logger", level=logging.INFO, pathname=__file__, lineno=90, msg="Request %s", args=(index,), exc_info=None)
+        for index in range(2)
+    ]
+
+    with patch.object(logging.Formatter, "format", autospec=True, side_effect=logging.Formatter.format) as base_format:
+        # Console and file handlers format the same record with the same formatter
+        outputs = [formatter.format(record) for record in (records[0], records[0], records[1])]
+
+    assert outputs == ["INFO:Request 0", "INFO:Request 0", "INFO:Request 1"]
+    assert base_format.call_count == 2
+
+
+def test_structured_text_formatter_formats_timestamp_once_per_second():
+    formatter = StructuredTextFormatter(fmt="%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    created = time.mktime((2025, 10, 27, 12, 34, 56, 0, 0, -1))
+    records = []
+    for offset in (0.1, 0.9, 1.2):
+        record = logging.LogRecord(name="test.logger", level=logging.INFO, pathname=__file__, lineno=95, msg="tick", args=(), exc_info=None)
+        record.created = created + offset
+        records.append(record)
+
+    with patch("app.logger.time.strftime", wraps=time.strftime) as strftime:
+        outputs = [formatter.format(record) for record in records]
+
+    assert outputs == ["2025-10-27 12:34:56 tick", "2025-10-27 12:34:56 tick", "2025-10-27 12:34:57 tick"]
+    assert strftime.call_count == 2
 
 
 def test_setup_logging_production_uses_console_only(tmp_path):
@@ -109,9 +261,10 @@ def test_setup_logging_production_uses_console_only(tmp_path):
         is_testing=False,
     )
 
-    root_handlers = logging.getLogger().handlers
-    assert any(isinstance(handler, logging.StreamHandler) for handler in root_handlers)
-    assert not any(isinstance(handler, logging.FileHandler) for handler in root_handlers)
+    assert logger_module._queue_listener is not None
+    output_handlers = logger_module._queue_listener.handlers
+    assert any(isinstance(handler, logging.StreamHandler) for handler in output_handlers)
+    assert not any(isinstance(handler, logging.FileHandler) for handler in output_handlers)
 
 
 def test_setup_logging_development_includes_file_handler(tmp_path):
@@ -126,6 +279,163 @@ def test_setup_logging_development_includes_file_handler(tmp_path):
         is_testing=False,
     )
 
+    assert logger_module._queue_listener is not None
+    output_handlers = logger_module._queue_listener.handlers
+    assert any(isinstance(handler, logging.StreamHandler) for handler in output_handlers)
+    assert any(isinstance(handler, logging.FileHandler) for handler in output_handlers)
+
+
+def test_setup_logging_reuses_handlers_for_same_configuration(tmp_path):
+    logger = logging.getLogger("test-reuse-logger")
+
+    setup_logging(app_logger=logger, log_dir=str(tmp_path), log_level="INFO", is_development=True, is_testing=False)
+    root_handlers = list(logging.getLogger().handlers)
+    listener = logger_module._queue_listener
+
+    setup_logging(app_logger=logger, log_dir=str(tmp_path), log_level="info", is_development=True, is_testing=False)
+    assert logging.getLogger().handlers == root_handlers
+    assert logger_module._queue_listener is listener
+
+    setup_logging(app_logger=logger, log_dir=str(tmp_path), log_level="DEBUG", is_development=True, is_testing=False)
+    assert logging.getLogger().handlers != root_handlers
+    assert logger_module._queue_listener is not listener
+    assert logger.level == logging.DEBUG
+
+
+def test_setup_logging_attaches_handlers_to_root_logger_only(tmp_path):
+    logger = logging.getLogger("test-root-only-logger")
+    logger.addHandler(logging.StreamHandler())
+    logger.propagate = False
+
+    setup_logging(app_logger=logger, log_dir=str(tmp_path), log_level="INFO", is_development=False, is_testing=False)
+
+    assert logger.handlers == []
+    assert logger.propagate is True
+    assert len(logging.getLogger().handlers) == 1
+
+
+def test_setup_logging_writes_through_background_queue(tmp_path):
+    logger = logging.getLogger("test-queue-logger")
+
+    setup_logging(
+        app_logger=logger,
+        log_dir=str(tmp_path),
+        log_level="INFO",
+        is_development=True,
+        is_testing=False,
+    )
+
     root_handlers = logging.getLogger().handlers
-    assert any(isinstance(handler, logging.StreamHandler) for handler in root_handlers)
-    assert any(isinstance(handler, logging.FileHandler) for handler in root_handlers)
+    assert len(root_handlers) == 1
+    assert isinstance(root_handlers[0], logging.handlers.QueueHandler)
+
+    logger.info("Login failed for user@example.com", extra={"password": "secret123"})
+    logger_module._stop_queue_listener()
+
+    output = "".join(log_file.read_text(encoding="utf-8") for log_file in tmp_path.glob("app-*.log"))
+    assert "Login failed for ***" in output
+    assert "[no-request]" in output
+    assert "secret123" not in output
+
+
+def test_queued_message_is_rendered_when_logged(tmp_path):
+    logger = logging.getLogger("test-queue-render-logger")
+    setup_logging(app_logger=logger, log_dir=str(tmp_path), log_level="INFO", is_development=True, is_testing=False)
+
+    items = ["first"]
+    logger.info("Items: %s for %s", items, "user@example.com")
+    items.append("added-after-logging")
+    logger_module._stop_queue_listener()
+
+    output = "".join(log_file.read_text(encoding="utf-8") for log_file in tmp_path.glob("app-*.log"))
+    assert "Items: ['first'] for ***" in output
+    assert "added-after-logging" not in output
+    assert "user@example.com" not in output
+
+
+def test_request_id_is_captured_before_record_leaves_request_thread(tmp_path):
+    logger = logging.getLogger("test-request-id-logger")
+    setup_logging(
+        app_logger=logger,
+        log_dir=str(tmp_path),
+        log_level="INFO",
+        is_development=True,
+        is_testing=False,
+    )
+
+    with Flask(__name__).test_request_context():
+        g.request_id = "req-abc"
+        logger.info("Inside request")
+    logger_module._stop_queue_listener()
+
+    output = "".join(log_file.read_text(encoding="utf-8") for log_file in tmp_path.glob("app-*.log"))
+    assert "[req-abc]" in output
+
+
+def test_rotated_log_namer_uses_rotation_date():
+    default_name = os.path.join("logs", "app-2025-10-27.log.2025-10-28")
+
+    assert _rotated_log_namer(default_name) == os.path.join("logs", "app-2025-10-28.log")
+    assert _rotated_log_namer("app-2025-10-27.log.2025-10-28") == "app-2025-10-28.log"
+    assert _rotated_log_namer(os.path.join("logs", "app.log")) == os.path.join("logs", "app.log")
+
+
+def test_sigterm_flushes_queued_log_records(tmp_path):
+    backend_dir = Path(__file__).resolve().parent.parent
+    script = (
+        "import logging, os, signal, time\n"
+        "from app.logger import setup_logging\n"
+        "logger = logging.getLogger('sigterm-test')\n"
+        f"setup_logging(logger, {str(tmp_path)!r}, 'INFO', is_development=True)\n"
+        "logger.info('Last record before shutdown')\n"
+        "os.kill(os.getpid(), signal.SIGTERM)\n"
+        "time.sleep(10)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], cwd=backend_dir, capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 128 + signal.SIGTERM
+    output = "".join(log_file.read_text(encoding="utf-8") for log_file in tmp_path.glob("app-*.log"))
+    assert "Last record before shutdown" in output
+
+
+def test_buffered_file_handler_flushes_immediately_only_for_warnings(tmp_path):
+    log_file = tmp_path / "app.log"
+    handler = logger_module._BufferedTimedRotatingFileHandler(filename=str(log_file), when="midnight", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(levelname)s:%(message)s"))
+
+    def make_record(level: int, msg: str) -> logging.LogRecord:
+        return logging.LogRecord(name="test.logger", level=level, pathname=__file__, lineno=1, msg=msg, args=(), exc_info=None)
+
+    try:
+        handler.handle(make_record(logging.INFO, "buffered"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.handle(make_record(logging.WARNING, "flushed"))
+        assert log_file.read_text(encoding="utf-8") == "INFO:buffered\nWARNING:flushed\n"
+
+        handler.handle(make_record(logging.INFO, "flushed on demand"))
+        handler.flush()
+        assert log_file.read_text(encoding="utf-8").endswith("INFO:flushed on demand\n")
+    finally:
+        handler.close()
+
+
+def test_lazy_request_id_is_generated_once_when_first_logged():
+    request_id_filter = RequestIDFilter()
+
+    with Flask(__name__).test_request_context():
+        lazy_id = LazyRequestID()
+        g.request_id = lazy_id
+        assert lazy_id._value is None
+
+        records = [
+            logging.LogRecord(name="test.logger", level=logging.INFO, pathname=__file__, lineno=1, msg="msg", args=(), exc_info=None)
+            for _ in range(2)
+        ]
+        for record in records:
+            request_id_filter.filter(record)
+
+    assert isinstance(records[0].request_id, str)
+    assert len(records[0].request_id) == 36
+    assert records[0].request_id == records[1].request_id == str(lazy_id)
@@ -0,0 +1,141 @@
+import logging
+from unittest.mock import patch
+
+import pytest
+
+
+class TestRequestCompletionLog:
+    """Tests for the after_request completion log."""
+
+    def test_logs_first_forwarded_client_ip(self, client, caplog: pytest.LogCaptureFixture):
+        """Test that the completion log records the first X-Forwarded-For address and timing."""
+        with caplog.at_level(logging.INFO):
+            client.get("/api/does-not-exist", headers={"X-Forwarded-For": "203.0.113.7, 10.0.0.1"})
+
+        record = next(record for record in caplog.records if record.getMessage() == "Request completed")
+        assert record.client_ip == "203.0.113.7"
+        assert record.status_code == 404
+        assert isinstance(record.duration_us, int)
+        assert record.duration_us >= 0
+
+    def test_skips_completion_log_when_info_disabled(self, app, client, caplog: pytest.LogCaptureFixture):
+        """Test that nothing is logged when INFO is disabled for the app logger."""
+        app.logger.setLevel(logging.WARNING)
+
+        with caplog.at_level(logging.WARNING):
+            client.get("/api/does-not-exist")
+
+        assert not any(record.getMessage() == "Request completed" for record in caplog.records)
+
+
+class TestCors:
+    """Tests for the CORS headers added for the frontend origin."""
+
+    def test_preflight_is_answered_with_cors_headers(self, client):
+        """Test that an OPTIONS preflight gets an empty 204 with the CORS headers."""
+        response = client.options("/api/auth/login", headers={"Origin": "http://localhost:5173", "Access-Control-Request-Method": "POST"})
+
+        assert response.status_code == 204
+        assert response.data == b""
+        assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:5173"
+        assert response.headers["Access-Control-Allow-Credentials"] == "true"
+        assert "POST" in response.headers["Access-Control-Allow-Methods"]
+
+    def test_regular_and_error_responses_include_cors_headers(self, client):
+        """Test that non-preflight responses, including errors, carry the CORS headers."""
+        response = client.get("/api/does-not-exist", headers={"Origin": "http://localhost:5173"})
+
+        assert response.status_code == 404
+        assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:5173"
+        assert response.headers["Access-Control-Allow-Credentials"] == "true"
+        assert "Origin" in response.vary
+
+    def test_foreign_origin_gets_no_cors_headers(self, client):
+        """Test that requests and preflights from another origin get no CORS headers."""
+        response = client.get("/api/does-not-exist", headers={"Origin": "https://evil.example.com"})
+
+        assert response.status_code == 404
+        assert "Access-Control-Allow-Origin" not in response.headers
+        assert "Access-Control-Allow-Credentials" not in response.headers
+        assert "Origin" in response.vary
+
+        preflight = client.options("/api/auth/login", headers={"Origin": "https://evil.example.com", "Access-Control-Request-Method": "POST"})
+
+        assert preflight.status_code != 204
+        assert "Access-Control-Allow-Origin" not in preflight.headers
+
+    def test_empty_frontend_url_disables_cors(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+        """Test that no CORS hooks are registered when FRONTEND_URL is empty."""
+        from app.config import Config
+        from app.main import create_app
+
+        monkeypatch.setenv("FRONTEND_URL", "")
+        monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'test.db'}")
+        monkeypatch.setenv("FLASK_ENV", "testing")
+        Config.refresh()
+
+        response = create_app().test_client().get("/api/does-not-exist")
+
+        assert response.status_code == 404
+        assert "Access-Control-Allow-Origin" not in response.headers
+
+
+class TestUnexpectedErrorResponse:
+    """Tests for the response returned for unhandled exceptions."""
+
+    def test_unhandled_exception_returns_json_500(self, app, client):
+        """Test that an unhandled exception returns the fixed JSON error body with CORS headers."""
+
+        def fail():
+            raise RuntimeError("boom")
+
+        app.add_url_rule("/api/test-unhandled-error", "test_unhandled_error", fail)
+
+        response = client.get("/api/test-unhandled-error", headers={"Origin": "http://localhost:5173"})
+
+        assert response.status_code == 500
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"error": {"code": 500, "message": "Internal server error"}}
+        assert response.headers["Access-Control-Allow-Origin"] == "http://localhost:5173"
+
+
+class TestInitAdminCommand:
+    """Tests for the init-admin CLI command."""
+
+    def test_init_admin_runs_admin_creation(self, app):
+        """Test that `flask init-admin` calls create_admin_user()."""
+        with patch("scripts.create_admin.create_admin_user") as create_admin_user:
+            result = app.test_cli_runner().invoke(args=["init-admin"])
+
+        assert result.exit_code == 0
+        create_admin_user.assert_called_once_with()
+
+
+class TestPurgeRefreshTokensCommand:
+    """Tests for the purge-refresh-tokens CLI command."""
+
+    def test_purge_deletes_expired_and_revoked_tokens(self, app, test_user):
+        """Test that only tokens that can still be used are kept."""
+        from datetime import datetime, timedelta, timezone
+
+        from app.database import get_session
+        from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with app.app_context():
+            session = get_session()
+            repo = RefreshTokenRepository(session)
+            repo.create("active", test_user, now + timedelta(days=1))
+            repo.create("expired", test_user, now - timedelta(days=1))
+            repo.create("revoked", test_user, now + timedelta(days=1))
+            repo.revoke("revoked")
+            session.commit()
+
+        result = app.test_cli_runner().invoke(args=["purge-refresh-tokens"])
+        assert result.exit_code == 0
+
+        with app.app_context():
+            repo = RefreshTokenRepository(get_session())
+            assert repo.find_by_token("active") is not None
+            assert repo.find_by_token("expired") is None
+            assert repo.find_by_token("revoked") is None
@@ -33,5 +33,5 @@ CREATE TABLE IF NOT EXISTS refresh_tokens (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 CREATE INDEX idx_refresh_tokens_token ON refresh_tokens (token);
-CREATE INDEX idx_refresh_tokens_user_id ON refresh_tokens (user_id);
+CREATE INDEX idx_refresh_tokens_user_revoked ON refresh_tokens (user_id, is_revoked);
 CREATE INDEX idx_refresh_tokens_expires_at ON refresh_tokens (expires_at);
@@ -0,0 +1,21 @@
+-- Migration: Replace refresh_tokens user_id index with (user_id, is_revoked)
+-- Date: 2026-10-16
+-- Description: Revoking a user's tokens filters on user_id and is_revoked, which the composite
+-- index covers. It also serves the user_id foreign key, so the single-column index is dropped.
+--
+-- IMPORTANT: This migration is for EXISTING databases only.
+-- New installations should use infra/mysql/init/001_init.sql instead (which already has the new index).
+--
+-- Usage:
+--   mysql -u root -p app_db < infra/mysql/migrations/003_refresh_tokens_user_revoked_index.sql
+--
+-- Or via Docker:
+--   docker exec -i fullstack-app-with-claude-db-1 mysql -u root -ppassword app_db < infra/mysql/migrations/003_refresh_tokens_user_revoked_index.sql
+
+-- Note: Database is already selected by SQLAlchemy connection, no USE statement needed
+
+-- Step 1: Create the composite index first so the foreign key always has a usable index
+CREATE INDEX idx_refresh_tokens_user_revoked ON refresh_tokens (user_id, is_revoked);
+
+-- Step 2: Drop the single-column index it replaces
+DROP INDEX idx_refresh_tokens_user_id ON refresh_tokens;